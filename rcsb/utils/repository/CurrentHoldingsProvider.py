@@ -13,26 +13,75 @@
 """Provide inventory of current repository content.
 """
 
+import array
+import bisect
+import concurrent.futures
 import datetime
 import logging
 import os.path
+import re
+import sys
+from operator import itemgetter
 
 import pytz
 
-from rcsb.utils.io.FileUtil import FileUtil
 from rcsb.utils.io.MarshalUtil import MarshalUtil
+from rcsb.utils.repository.HoldingsFileUtil import HoldingsFileUtil
 from rcsb.utils.struct.EntryInfoProvider import EntryInfoProvider
 
+try:
+    from ciso8601 import parse_datetime as _parseDateTime
+except ImportError:  # pragma: no cover
+    _parseDateTime = datetime.datetime.fromisoformat
+
 logger = logging.getLogger(__name__)
 
+# Assembly identifiers in assembly file names (e.g., "7a09-assembly1.cif.gz" and "302d.pdb1.gz")
+_ASSEMBLY_MMCIF_PATTERN = re.compile(r"-assembly(\d+)\.cif")
+_ASSEMBLY_PDB_PATTERN = re.compile(r"\.pdb(\d+)\.gz$")
+# Validation report file name suffixes and the corresponding RCSB.org content types
+_VALIDATION_CONTENT_TYPES = (
+    ("full_validation.pdf.gz", "validation report"),
+    ("validation.svg.gz", "validation slider image"),
+    ("validation.cif.gz", "validation data mmCIF"),
+    ("validation_2fo-fc_map_coef.cif.gz", "validation 2fo-fc coefficients"),
+    ("validation_fo-fc_map_coef.cif.gz", "validation fo-fc coefficients"),
+)
+# Layout version of the preprocessed holdings side cache (increment when the stored structures change)
+_SIDE_CACHE_VERSION = 5
+# Marker for attributes that are loaded on first use
+_NOT_LOADED = object()
+
+
+def _upperId(idCode):
+    """Return the upper case identifier, reusing the input string when it is already upper case."""
+    return idCode if idCode.isupper() else idCode.upper()
+
 
 class CurrentHoldingsProvider(object):
     """Provide inventory of current repository content."""
 
+    __slots__ = (
+        "__cachePath",
+        "__dirPath",
+        "__storeCache",
+        "__mU",
+        "__hfU",
+        "__invD",
+        "__idCodes",
+        "__idTimes",
+        "__useCache",
+        "__refdataLocators",
+        "__contentTypeIndexD",
+        "__refIdByTypeD",
+        "__eiP",
+    )
+
     def __init__(self, cachePath, useCache=False, **kwargs):
         self.__cachePath = cachePath
         self.__dirPath = os.path.join(cachePath, "holdings")
         self.__storeCache = kwargs.get("storeCache", False)
+        self.__useCache = useCache
         #
         edMapsLocator = kwargs.get("edmapsLocator", "https://raw.githubusercontent.com/rcsb/py-rcsb_exdb_assets/master/fall_back/edmaps.json")
         #
@@ -44,85 +93,131 @@ class CurrentHoldingsProvider(object):
         entryUrlIds = os.path.join(baseUrl, "released_structures_last_modified_dates.json.gz")
         entryUrlFallbackIds = os.path.join(fallbackUrl, "released_structures_last_modified_dates.json.gz")
         #
-        refdataUrlIds = os.path.join(baseUrl, "refdata_id_list.json.gz")
-        refdataUrlFallbackIds = os.path.join(fallbackUrl, "refdata_id_list.json.gz")
+        # Reference data identifiers are loaded on first use
+        self.__refdataLocators = (os.path.join(baseUrl, "refdata_id_list.json.gz"), os.path.join(fallbackUrl, "refdata_id_list.json.gz"))
         #
         self.__mU = MarshalUtil(workPath=self.__dirPath)
-
-        self.__invD = self.__reloadEntryContent(entryUrlContent, entryUrlFallbackContent, edMapsLocator, self.__dirPath, useCache=useCache)
-        self.__idD = self.__reloadEntryIds(entryUrlIds, entryUrlFallbackIds, self.__dirPath, useCache=useCache)
-        self.__refD = self.__reloadRefdataIds(refdataUrlIds, refdataUrlFallbackIds, self.__dirPath, useCache=useCache)
-        # EntryInfoProvider must be cached before this class is invoked -
-        self.__eiP = EntryInfoProvider(cachePath=self.__cachePath, useCache=True)
-        ok = self.__eiP.testCache()
-        if not ok:
-            self.__eiP = None
+        self.__hfU = HoldingsFileUtil(workPath=self.__dirPath)
+        #
+        # Preprocessed holdings are stored in a pickle side cache to skip JSON parsing on subsequent (storeCache) loads
+        sideCachePath = os.path.join(self.__dirPath, "current_holdings_preprocessed.pic")
+        sourcePathL = [self.__hfU.getCachePath(url, self.__dirPath) for url in [entryUrlContent, entryUrlIds, edMapsLocator]]
+        sD = self.__hfU.importSideCache(sideCachePath, sourcePathL, _SIDE_CACHE_VERSION) if self.__storeCache and useCache else None
+        if sD:
+            self.__invD = sD["invD"]
+            self.__idCodes, self.__idTimes = tuple(sD["idCodes"]), sD["idTimes"]
+        else:
+            # The entry holdings files are independent - fetch and parse them concurrently (each thread with its own file utilities)
+            self.__mU.mkdir(self.__dirPath)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+                hfU = HoldingsFileUtil(workPath=self.__dirPath)
+                invF = ex.submit(self.__reloadEntryContent, hfU, entryUrlContent, entryUrlFallbackContent, edMapsLocator, self.__dirPath, useCache=useCache)
+                hfU = HoldingsFileUtil(workPath=self.__dirPath)
+                idF = ex.submit(self.__reloadEntryIds, hfU, entryUrlIds, entryUrlFallbackIds, self.__dirPath, useCache=useCache)
+                # A failure in one reload leaves the other intact
+                self.__invD = self.__getReloadResult(invF, {})
+                # Entry ID codes and last modified times (float epoch seconds) held as parallel sequences ordered by time
+                self.__idCodes, self.__idTimes = self.__getReloadResult(idF, ((), array.array("d")))
+            if self.__storeCache and self.__invD and self.__idCodes:
+                sD = {"invD": self.__invD, "idCodes": self.__idCodes, "idTimes": self.__idTimes}
+                ok = self.__hfU.exportSideCache(sideCachePath, sourcePathL, _SIDE_CACHE_VERSION, sD)
+                logger.info("Stored preprocessed holdings in %s (%r)", sideCachePath, ok)
+        self.__contentTypeIndexD = None
+        # Reference data and entry info are loaded on first use
+        self.__refIdByTypeD = None
+        self.__eiP = _NOT_LOADED
 
     def testCache(self, minCount=220000):
-        logger.info("Inventory length cD (%d) id list (%d)", len(self.__invD), len(self.__idD))
+        logger.info("Inventory length cD (%d) id list (%d)", len(self.__invD), len(self.__idCodes))
         # JDW - restore consistency checks
-        # if len(self.__invD) > minCount and len(self.__idD) > minCount and len(self.__invD) == len(self.__idD):
-        if len(self.__invD) > minCount and len(self.__idD) > minCount:
+        # if len(self.__invD) > minCount and len(self.__idCodes) > minCount and len(self.__invD) == len(self.__idCodes):
+        if len(self.__invD) > minCount and len(self.__idCodes) > minCount:
             return True
         return False
 
+    def normalizeId(self, entryId):
+        """Return the canonical (upper case) form of the input entry identifier used as the inventory key.
+
+        Args:
+            entryId (str): entry identifier
+
+        Returns:
+            (str): canonical entry identifier
+        """
+        return _upperId(entryId)
+
+    def __getEntry(self, entryId):
+        # Inventory keys are canonical upper case identifiers; other forms are normalized only on a miss
+        if not isinstance(entryId, str):
+            logger.error("Failing for unexpected entry identifier %r", entryId)
+            return None
+        tD = self.__invD.get(entryId)
+        return tD if tD is not None else self.__invD.get(_upperId(entryId))
+
     def hasEntryContentType(self, entryId, contentType):
         """Return if the current content types is available for the input entry identifier"""
-        try:
-            return contentType in self.__invD[entryId.upper()]
-        except Exception as e:
-            logger.exception("Failing for %r with %s", entryId, str(e))
-        return False
+        tD = self.__getEntry(entryId)
+        return tD is not None and contentType in tD
 
     def getEntryContentTypes(self, entryId):
         """Return the current content types for the input entry identifier"""
-        try:
-            return sorted(self.__invD[entryId.upper()].keys())
-        except Exception as e:
-            logger.exception("Failing for %r with %s", entryId, str(e))
-        return []
+        tD = self.__getEntry(entryId)
+        return sorted(tD) if tD is not None else []
 
     def getAllContentTypes(self):
         """Return the all current content types for the repository"""
-        entryId = None
-        try:
-            tS = set()
-            for entryId, tD in self.__invD.items():
-                for ky in tD:
-                    tS.add(ky)
-            return sorted(tS)
-        except Exception as e:
-            logger.exception("Failing for %r with %s", entryId, str(e))
-        return []
+        return list(self.__getContentTypeIndex())
+
+    def getEntriesByContentType(self, contentType):
+        """Return the entry identifiers having the input content type.
+
+        Args:
+            contentType (str): repository content type (e.g., "mmcif", "validation_report")
+
+        Returns:
+            (frozenset): entry identifiers with the input content type
+        """
+        return self.__getContentTypeIndex().get(contentType, frozenset())
+
+    def __getContentTypeIndex(self):
+        # Content type -> entry identifier index built in a single pass on first use (ordered by content type).
+        # Failures are reported once here, so the accessors using the index need no exception handling.
+        if self.__contentTypeIndexD is None:
+            try:
+                tD = {}
+                for entryId, ctD in self.__invD.items():
+                    for contentType in ctD:
+                        tD.setdefault(contentType, []).append(entryId)
+                self.__contentTypeIndexD = {contentType: frozenset(tD[contentType]) for contentType in sorted(tD)}
+            except Exception as e:
+                logger.exception("Failing with %s", str(e))
+                self.__contentTypeIndexD = {}
+        return self.__contentTypeIndexD
 
     def getEntryContentTypePathList(self, entryId, contentType):
         """Return the current content types for the input entry identifier"""
-        try:
-            return self.__invD[entryId.upper()][contentType]
-        except Exception as e:
-            logger.debug("Failing for %r %r with %s", entryId, contentType, str(e))
-        return []
+        tD = self.__getEntry(entryId)
+        return tD.get(contentType, []) if tD is not None else []
 
     def getEntryInventory(self):
         """Return the current inventory dictionary"""
-        try:
-            return self.__invD
-        except Exception as e:
-            logger.debug("Failing with %s", str(e))
-        return {}
+        return self.__invD
 
     def getEntryIdList(self, afterDateTimeStamp=None):
         """Return the ID code list or optionally IDs changed after the input time stamp.
 
         Args:
-            afterDateTimeStamp (str, optional): ISO format date time stamp. Defaults to None.
+            afterDateTimeStamp (str, optional): ISO format date time stamp (interpreted as UTC). Defaults to None.
+
+        Returns:
+            (list): entry ID codes
         """
         try:
             if afterDateTimeStamp:
-                dt = datetime.datetime.fromisoformat(afterDateTimeStamp).replace(tzinfo=pytz.utc)
-                return [k for k, v in self.__idD.items() if v > dt]
+                dt = _parseDateTime(afterDateTimeStamp).replace(tzinfo=pytz.utc)
+                return list(self.__idCodes[bisect.bisect_right(self.__idTimes, dt.timestamp()) :])
             else:
-                return list(self.__idD.keys())
+                return list(self.__idCodes)
         except Exception as e:
             logger.error("Failing with %s", str(e))
         #
@@ -145,32 +240,38 @@ class CurrentHoldingsProvider(object):
         return self.__getRefIdListByType("CC")
 
     def __getRefIdListByType(self, refType):
-        idL = []
-        try:
-            for rId, tup in self.__refD.items():
-                if tup and tup[0] == refType:
-                    idL.append(rId)
-        except Exception as e:
-            logger.exception("Failing with %s", str(e))
-        return idL
+        if self.__refIdByTypeD is None:
+            urlTarget, urlFallbackTarget = self.__refdataLocators
+            self.__refIdByTypeD = self.__buildRefIdIndex(self.__reloadRefdataIds(urlTarget, urlFallbackTarget, self.__dirPath, useCache=self.__useCache))
+        return self.__refIdByTypeD.get(refType, ())
+
+    def __buildRefIdIndex(self, refD):
+        """Bucket the reference data identifiers by type in a single pass.
+
+        Args:
+            refD (dict): {refId: (content type, last modified date), ...}
+
+        Returns:
+            (dict): {content type: (refId, ...), ...}
+        """
+        tD = {}
+        for rId, tup in refD.items():
+            if tup:
+                tD.setdefault(tup[0], []).append(rId)
+        return {refType: tuple(rIdL) for refType, rIdL in tD.items()}
 
     # ---
     def getStatusDetails(self):
-        retD = {}
-        for entryId in self.__invD:
-            retD[entryId] = {"status": "CURRENT", "status_code": "REL"}
-        return retD
+        """Return the status details for current entries {entryId: {"status": "CURRENT", "status_code": "REL"}, ...}"""
+        return {entryId: {"status": "CURRENT", "status_code": "REL"} for entryId in self.__invD}
 
     def hasValidationReportData(self, entryId):
         return self.__hasValidationReportData(self.__invD, entryId)
 
     def __hasValidationReportData(self, invD, entryId):
-        if entryId.upper() in invD:
-            tD = invD[entryId.upper()]
-            if "validation_report" in tD:
-                for pth in tD["validation_report"]:
-                    if pth[-7:] == ".xml.gz":
-                        return True
+        tD = (invD.get(entryId) or invD.get(_upperId(entryId))) if isinstance(entryId, str) else None
+        if tD:
+            return any(pth.endswith(".xml.gz") for pth in tD.get("validation_report", ()))
         return False
 
     def __assembleEntryContentTypes(self, invD):
@@ -202,19 +303,28 @@ class CurrentHoldingsProvider(object):
             # "FASTA sequence",
         }
         #
-        noPolymerL = self.__eiP.getEntriesByPolymerEntityCount(count=0) if self.__eiP else []
-        logger.info("Entries missing polymers (%d)", len(noPolymerL))
-        # for id in noPolymerL:
+        eiP = self.__getEntryInfoProvider()
+        noPolymerS = frozenset(eiP.getEntriesByPolymerEntityCount(count=0) or []) if eiP else frozenset()
+        logger.info("Entries missing polymers (%d)", len(noPolymerS))
+        # for id in noPolymerS:
         #    logger.info("id: %s", id)
         ctD = {}
         assemD = {}
+        searchAssemblyMmCif = _ASSEMBLY_MMCIF_PATTERN.search
+        searchAssemblyPdb = _ASSEMBLY_PDB_PATTERN.search
+        # Interned keys match the interned inventory content type keys by identity
+        getContentType = {sys.intern(ky): val for ky, val in contentTypeD.items()}.get
         for entryId, tD in invD.items():
             assemS = set()
-            if entryId not in noPolymerL:
-                ctD.setdefault(entryId, []).append("FASTA sequence")
+            entryTypeL = []
+            addType = entryTypeL.append
+            if entryId not in noPolymerS:
+                addType("FASTA sequence")
             for contentType, pthL in tD.items():
-                if contentType in contentTypeD:
-                    ctD.setdefault(entryId, []).append(contentTypeD[contentType])
+                rcsbContentType = getContentType(contentType)
+                if rcsbContentType:
+                    addType(rcsbContentType)
+                # Note that the assembly content types are both mapped above and parsed below
                 if contentType == "validation_report":
                     # "/pdb/validation_reports/01/201l/201l_full_validation.pdf.gz"
                     # "/pdb/validation_reports/01/201l/201l_multipercentile_validation.png.gz"
@@ -223,161 +333,112 @@ class CurrentHoldingsProvider(object):
                     # "/pdb/validation_reports/01/201l/201l_validation.xml.gz"
                     # "/pdb/validation_reports/01/201l/201l_validation_2fo-fc_map_coef.cif.gz"
                     # "/pdb/validation_reports/01/201l/201l_validation_fo-fc_map_coef.cif.gz"
+                    # Each validation content type is added once per entry even if matching paths repeat
+                    foundS = set()
                     for pth in pthL:
                         # Use "_full_validation.pdf.gz" instead of just ".pdf.gz" to avoid re-appending for non-full "_validation.pdf.gz" file
-                        if "full_validation.pdf.gz" in pth:
-                            ctD.setdefault(entryId, []).append("validation report")
-                        elif "validation.svg.gz" in pth:
-                            ctD.setdefault(entryId, []).append("validation slider image")
-                        elif "validation.cif.gz" in pth:
-                            ctD.setdefault(entryId, []).append("validation data mmCIF")
-                        elif "validation_2fo-fc_map_coef.cif.gz" in pth:
-                            ctD.setdefault(entryId, []).append("validation 2fo-fc coefficients")
-                        elif "validation_fo-fc_map_coef.cif.gz" in pth:
-                            ctD.setdefault(entryId, []).append("validation fo-fc coefficients")
-                if contentType == "assembly_mmcif":
+                        for suffix, validationType in _VALIDATION_CONTENT_TYPES:
+                            if pth.endswith(suffix):
+                                if validationType not in foundS:
+                                    foundS.add(validationType)
+                                    addType(validationType)
+                                break
+                elif contentType == "assembly_mmcif":
                     # "/pdb/data/biounit/mmCIF/divided/a0/7a09-assembly1.cif.gz"
                     for pth in pthL:
-                        fn = os.path.basename(pth)
-                        aId = fn.split(".")[0].split("-")[1].replace("assembly", "")
-                        assemS.add(aId)
-
-                if contentType == "assembly_pdb":
+                        mObj = searchAssemblyMmCif(pth)
+                        if mObj:
+                            assemS.add(mObj.group(1))
+                elif contentType == "assembly_pdb":
                     # "/pdb/data/biounit/coordinates/divided/02/302d.pdb1.gz"
                     for pth in pthL:
-                        fn = os.path.basename(pth)
-                        aId = fn.split(".")[1].replace("pdb", "")
-                        assemS.add(aId)
+                        mObj = searchAssemblyPdb(pth)
+                        if mObj:
+                            assemS.add(mObj.group(1))
+            if entryTypeL:
+                ctD[entryId] = entryTypeL
             assemD[entryId] = list(assemS)
         return ctD, assemD
 
-    def __addMapContents(self, invD, mapD):
-        """Add map content types to the entry inventory
+    def __getEntryInfoProvider(self):
+        if self.__eiP is _NOT_LOADED:
+            # EntryInfoProvider must be cached before this class is invoked -
+            eiP = EntryInfoProvider(cachePath=self.__cachePath, useCache=True)
+            self.__eiP = eiP if eiP.testCache() else None
+        return self.__eiP
 
-        Args:
-            invD (dict): entry inventory
-            mapD (dict): map inventory
-
-            Example - edmaps.json {"6aok": {"2fofc": "true", "fofc": "true"}, "4ih7": {"2fofc": "true", "fofc": "true"}, ...}
-        """
-        for entryId in invD:
-            if entryId.lower() in mapD:
-                tD = mapD[entryId.lower()]
-                if "2fofc" in tD and tD["2fofc"] == "true":
-                    invD[entryId]["mtz_map_coefficients"] = []
-        return invD
+    def __getReloadResult(self, future, defaultValue):
+        try:
+            return future.result()
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return defaultValue
 
-    def __reloadEdmapContent(self, edmapsLocator, dirPath):
+    def __reloadEdmapContent(self, hfU, edmapsLocator, dirPath, useCache=True):
         invD = {}
         try:
-            invD = self.__mU.doImport(edmapsLocator, fmt="json")
+            # The edmaps inventory is fetched once (to the cache directory when storeCache is set) and parsed
+            invD = hfU.reload(edmapsLocator, edmapsLocator, dirPath, storeCache=self.__storeCache, useCache=useCache)
             logger.info("Loaded edmaps inventory from %s (%r)", edmapsLocator, len(invD))
-            #
-            if self.__storeCache:
-                fU = FileUtil()
-                fn = fU.getFileName(edmapsLocator)
-                fp = os.path.join(dirPath, fn)
-                self.__mU.mkdir(dirPath)
-                ok = fU.get(edmapsLocator, fp)
-                logger.info("Fetch edmaps inventory from %s to %s (%r)", edmapsLocator, fp, ok)
         except Exception as e:
             logger.exception("Failing for %r with %s", edmapsLocator, str(e))
         return invD
 
-    def __reloadEntryContent(self, urlTarget, urlFallbackTarget, edMapsLocator, dirPath, useCache=True):
-        invD = {}
-        fU = FileUtil()
-        fn = fU.getFileName(urlTarget)
-        fp = os.path.join(dirPath, fn)
-        self.__mU.mkdir(dirPath)
+    def __reloadEntryContent(self, hfU, urlTarget, urlFallbackTarget, edMapsLocator, dirPath, useCache=True):
+        # Example - edmaps.json {"6aok": {"2fofc": "true", "fofc": "true"}, "4ih7": {"2fofc": "true", "fofc": "true"}, ...}
+        mapD = {entryId.upper(): tD for entryId, tD in (self.__reloadEdmapContent(hfU, edMapsLocator, dirPath, useCache=useCache) or {}).items()}
+        invD = hfU.reload(urlTarget, urlFallbackTarget, dirPath, storeCache=self.__storeCache, useCache=useCache)
+        logger.info("Current inventory (%d)", len(invD))
         #
-        if self.__storeCache and useCache and self.__mU.exists(fp):
-            invD = self.__mU.doImport(fp, fmt="json")
-            logger.info("Reading cached inventory (%d)", len(invD))
-        else:
-            invD = self.__mU.doImport(urlTarget, fmt="json")
-            logger.info("Loaded inventory from %s (%r)", urlTarget, len(invD))
-            if len(invD) == 0:
-                invD = self.__mU.doImport(urlFallbackTarget, fmt="json")
-                logger.info("Loaded fallback inventory from %s (%r)", urlFallbackTarget, len(invD))
-            mapD = self.__reloadEdmapContent(edMapsLocator, self.__dirPath)
-            invD = self.__addMapContents(invD, mapD)
-            del mapD
-            #
-            # previous method - save file locally
-            if self.__storeCache:
-                logger.info("Fetch inventory from %s", urlTarget)
-                ok = fU.get(urlTarget, fp)
-                if not ok:
-                    ok = fU.get(urlFallbackTarget, fp)
-                if ok:
-                    ofp = fp[:-3] if fp.endswith(".gz") else fp
-                    ok = self.__mU.doExport(ofp, invD, fmt="json", indent=3)
-                    if fp.endswith(".gz"):
-                        logger.info("Updating the current entry contents (%r) in %r", ok, fp)
-                        fU.compress(ofp, fp)
-        return invD
-
-    def __reloadEntryIds(self, urlTarget, urlFallbackTarget, dirPath, useCache=True):
-        tD = {}
+        # Canonicalize entry identifiers to upper case and intern them (shared with the entry ID list),
+        # intern the small set of content type keys repeated across all entries and add map content
+        # types in the same pass over the inventory
+        rD = {}
+        for entryId, tD in invD.items():
+            entryId = sys.intern(_upperId(entryId))
+            tD = {sys.intern(ky): pthL for ky, pthL in tD.items()}
+            if entryId in mapD and mapD[entryId].get("2fofc") == "true":
+                tD["mtz_map_coefficients"] = []
+            rD[entryId] = tD
+        return rD
+
+    def __reloadEntryIds(self, hfU, urlTarget, urlFallbackTarget, dirPath, useCache=True):
         idD = {}
-        fU = FileUtil()
-        fn = fU.getFileName(urlTarget)
-        fp = os.path.join(dirPath, fn)
-        self.__mU.mkdir(dirPath)
+        tD = hfU.reload(urlTarget, urlFallbackTarget, dirPath, storeCache=self.__storeCache, useCache=useCache)
+        logger.info("Current ID list (%d)", len(tD))
         #
-        if self.__storeCache and useCache and self.__mU.exists(fp):
-            tD = self.__mU.doImport(fp, fmt="json")
-            logger.info("Reading cached IDs list (%d)", len(tD))
-        else:
-            tD = self.__mU.doImport(urlTarget, fmt="json")
-            logger.info("Loaded ID list from %s (%r)", urlTarget, len(tD))
-            if len(tD) == 0:
-                tD = self.__mU.doImport(urlFallbackTarget, fmt="json")
-                logger.info("Loaded fallback ID list from %s (%r)", urlFallbackTarget, len(tD))
-        #
-        if self.__storeCache:
-            logger.info("Fetch ID list from %s", urlTarget)
-            ok = fU.get(urlTarget, fp)
-            if not ok:
-                ok = fU.get(urlFallbackTarget, fp)
-        #
-        for k, v in tD.items():
-            try:
-                idD[k] = datetime.datetime.fromisoformat(v)
-            except Exception as e:
-                logger.error("Date processing failing for %r %r with %s", k, v, str(e))
+        fromIso = _parseDateTime
+        utc = pytz.utc
+        try:
+            dtD = {k: fromIso(v) for k, v in tD.items()}
+        except (TypeError, ValueError):
+            # Fall back to item-wise parsing to report the offending dates
+            dtD = {}
+            for k, v in tD.items():
+                try:
+                    dtD[k] = fromIso(v)
+                except Exception as e:
+                    logger.error("Date processing failing for %r %r with %s", k, v, str(e))
+        for k, dt in dtD.items():
+            # Fractional seconds are kept so that time stamp comparisons match those on the parsed datetimes
+            idD[k] = (dt if dt.tzinfo else dt.replace(tzinfo=utc)).timestamp()
         #
-        sTupL = sorted(idD.items(), key=lambda item: item[1])
-        return {k: v for k, v in sTupL}
+        sTupL = sorted(idD.items(), key=itemgetter(1))
+        return tuple(sys.intern(k) for k, _ in sTupL), array.array("d", [t for _, t in sTupL])
 
     def __reloadRefdataIds(self, urlTarget, urlFallbackTarget, dirPath, useCache=True):
-        tD = {}
-        idD = {}
-        fU = FileUtil()
-        fn = fU.getFileName(urlTarget)
-        fp = os.path.join(dirPath, fn)
-        self.__mU.mkdir(dirPath)
-        #
-        if self.__storeCache and useCache and self.__mU.exists(fp):
-            tD = self.__mU.doImport(fp, fmt="json")
-            logger.info("Reading cached IDs list (%d)", len(tD))
-        else:
-            tD = self.__mU.doImport(urlTarget, fmt="json")
-            logger.info("Loaded ID list from %s (%r)", urlTarget, len(tD))
-            if len(tD) == 0:
-                tD = self.__mU.doImport(urlFallbackTarget, fmt="json")
-                logger.info("Loaded fallback ID list from %s (%r)", urlFallbackTarget, len(tD))
+        tD = self.__hfU.reload(urlTarget, urlFallbackTarget, dirPath, storeCache=self.__storeCache, useCache=useCache)
+        logger.info("Reference data ID list (%d)", len(tD))
         #
-        if self.__storeCache:
-            logger.info("Fetch ID list from %s", urlTarget)
-            ok = fU.get(urlTarget, fp)
-            if not ok:
-                ok = fU.get(urlFallbackTarget, fp)
-        #
-        for k, v in tD.items():
-            try:
-                idD[k] = (v["content_type"], datetime.datetime.fromisoformat(v["last_modified_date"]))
-            except Exception as e:
-                logger.error("Date processing failing for %r %r with %s", k, v, str(e))
+        fromIso = _parseDateTime
+        try:
+            idD = {k: (sys.intern(v["content_type"]), fromIso(v["last_modified_date"])) for k, v in tD.items()}
+        except (KeyError, TypeError, ValueError):
+            # Fall back to item-wise parsing to report the offending records
+            idD = {}
+            for k, v in tD.items():
+                try:
+                    idD[k] = (sys.intern(v["content_type"]), fromIso(v["last_modified_date"]))
+                except Exception as e:
+                    logger.error("Date processing failing for %r %r with %s", k, v, str(e))
         return idD
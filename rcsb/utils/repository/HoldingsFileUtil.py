@@ -0,0 +1,316 @@
+##
+# File:    HoldingsFileUtil.py
+# Date:    16-Oct-2026
+#
+# Updates:
+#
+##
+"""
+Utilities for fetching, caching and decoding (gzipped) JSON repository holdings files.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "john.westbrook@rcsb.org"
+__license__ = "Apache 2.0"
+
+import gzip
+import io
+import json
+import logging
+import os.path
+import pickle
+import shutil
+import sys
+import urllib.error
+import urllib.request
+import zlib
+
+from rcsb.utils.io.FileUtil import FileUtil
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Upper limit on the decompressed/compressed size ratio trusted when presizing decompression buffers
+_MAX_PRESIZE_RATIO = 64
+
+
+def truncateDate(dateString):
+    """Return the (interned) yyyy-mm-dd portion of the input date string, so that records sharing a date share a single date string."""
+    return sys.intern(dateString[:10])
+
+
+class HoldingsFileUtil(object):
+    """Utilities for fetching, caching and decoding (gzipped) JSON repository holdings files."""
+
+    def __init__(self, workPath=None, timeout=120):
+        self.__workPath = workPath
+        self.__timeout = timeout
+        self.__mU = MarshalUtil(workPath=self.__workPath)
+        self.__fU = FileUtil(workPath=self.__workPath)
+        # Layout version of pickled holdings data
+        self.__pickleVersion = 2
+
+    def reload(self, urlTarget, urlFallbackTarget, dirPath, storeCache=False, useCache=True):
+        """Reload JSON holdings data from the target (or fallback) locator. When storeCache is set, the
+        holdings file is kept in the local cache directory and refreshed only when modified upstream.
+
+        Args:
+            urlTarget (str): target locator for the holdings file
+            urlFallbackTarget (str): fallback locator for the holdings file
+            dirPath (str): holdings cache directory path
+            storeCache (bool, optional): keep a local copy of the holdings file in dirPath. Defaults to False.
+            useCache (bool, optional): use any existing cached holdings file without checking for updates. Defaults to True.
+
+        Returns:
+            (dict): JSON holdings data
+        """
+        rD = {}
+        if storeCache:
+            fp = self.syncCache(urlTarget, urlFallbackTarget, dirPath, useCache=useCache)
+            if fp:
+                rD = self.__reloadParsed(fp)
+                logger.info("Reading cached holdings file %s (%d)", fp, len(rD))
+        if not rD:
+            rD = self.importJson(urlTarget)
+            logger.info("Loaded holdings file from %s (%r)", urlTarget, len(rD))
+        if not rD:
+            rD = self.importJson(urlFallbackTarget)
+            logger.info("Loaded fallback holdings file from %s (%r)", urlFallbackTarget, len(rD))
+        return rD
+
+    def syncCache(self, urlTarget, urlFallbackTarget, dirPath, useCache=True):
+        """Bring the cached copy of the target (or fallback) holdings file up to date.
+
+        Args:
+            urlTarget (str): target locator for the holdings file
+            urlFallbackTarget (str): fallback locator for the holdings file
+            dirPath (str): holdings cache directory path
+            useCache (bool, optional): use any existing cached holdings file without checking for updates. Defaults to True.
+
+        Returns:
+            (str): local cache file path or None if no cached copy is available
+        """
+        fp = self.getCachePath(urlTarget, dirPath)
+        self.__mU.mkdir(dirPath)
+        if not (useCache and self.__mU.exists(fp)):
+            ok = self.fetch(urlTarget, urlFallbackTarget, fp)
+            logger.info("Fetch holdings file from %s to %s (%r)", urlTarget, fp, ok)
+        return fp if self.__mU.exists(fp) else None
+
+    def getCachePath(self, urlTarget, dirPath):
+        """Return the local cache path for the input holdings file locator.
+
+        Args:
+            urlTarget (str): target locator for the holdings file
+            dirPath (str): holdings cache directory path
+
+        Returns:
+            (str): local cache file path
+        """
+        return os.path.join(dirPath, self.__fU.getFileName(urlTarget))
+
+    def importJson(self, locator):
+        """Import JSON holdings data. Local files are read in a single pass, and remote (http/https) files
+        are decompressed as they are streamed from the response, without an intermediate download.
+        Data are decoded with orjson when it is available (or with json otherwise).
+
+        Args:
+            locator (str): file path or URL for JSON (or gzipped JSON) holdings data
+
+        Returns:
+            (dict): JSON holdings data or an empty dictionary on failure
+        """
+        try:
+            if os.path.isfile(locator):
+                data = self.__readGzipBytes(locator) if locator.endswith(".gz") else self.__readBytes(locator)
+                return self.__loads(data)
+            if locator.startswith(("http://", "https://")):
+                with urllib.request.urlopen(locator, timeout=self.__timeout) as resp:
+                    if locator.endswith(".gz"):
+                        with io.BufferedReader(gzip.GzipFile(fileobj=resp), buffer_size=1 << 18) as ifh:
+                            return self.__loads(ifh.read())
+                    return self.__loads(resp.read())
+            return self.__mU.doImport(locator, fmt="json") or {}
+        except Exception as e:
+            logger.exception("Failing for %r with %s", locator, str(e))
+        return {}
+
+    def fetch(self, urlTarget, urlFallbackTarget, fp):
+        """Fetch the target (or fallback) holdings file to a local path. Remote requests are made conditional
+        (If-None-Match/If-Modified-Since) on the ETag and Last-Modified headers recorded for the existing local copy.
+
+        Args:
+            urlTarget (str): target locator for the holdings file
+            urlFallbackTarget (str): fallback locator for the holdings file
+            fp (str): local file path
+
+        Returns:
+            bool: True if the local copy is current or False otherwise
+        """
+        hdrPath = fp + ".etag"
+        for url in [urlTarget, urlFallbackTarget]:
+            try:
+                if not url.startswith(("http://", "https://")):
+                    if self.__fU.get(url, fp):
+                        return True
+                    continue
+                #
+                hdrD = (self.__mU.doImport(hdrPath, fmt="json") or {}) if self.__mU.exists(fp) and self.__mU.exists(hdrPath) else {}
+                reqHdrD = {reqKy: hdrD[ky] for ky, reqKy in [("ETag", "If-None-Match"), ("Last-Modified", "If-Modified-Since")] if hdrD.get(ky)}
+                try:
+                    with urllib.request.urlopen(urllib.request.Request(url, headers=reqHdrD), timeout=self.__timeout) as resp:
+                        tmpPath = fp + ".tmp"
+                        with open(tmpPath, "wb") as ofh:
+                            shutil.copyfileobj(resp, ofh, 1 << 20)
+                        os.replace(tmpPath, fp)
+                        hdrD = {ky: resp.headers.get(ky) for ky in ["ETag", "Last-Modified"] if resp.headers.get(ky)}
+                except urllib.error.HTTPError as e:
+                    if e.code == 304:
+                        logger.info("Holdings file %s not modified (%r)", url, reqHdrD)
+                        return True
+                    raise
+                self.__mU.doExport(hdrPath, hdrD, fmt="json")
+                logger.info("Fetched holdings file %s to %s", url, fp)
+                return True
+            except Exception as e:
+                logger.warning("Fetch failing for %r with %s", url, str(e))
+        return False
+
+    def __reloadParsed(self, fp):
+        """Return the parsed content of the cached holdings file, reusing a pickle of the parsed data
+        stored alongside the file when it was derived from the current file.
+
+        Args:
+            fp (str): local path to the cached holdings file
+
+        Returns:
+            (dict): JSON holdings data
+        """
+        picPath = fp + ".pic"
+        rD = self.importSideCache(picPath, [fp], self.__pickleVersion)
+        if not rD:
+            rD = self.importJson(fp)
+            if rD:
+                self.exportSideCache(picPath, [fp], self.__pickleVersion, rD)
+        return rD
+
+    def importSideCache(self, filePath, sourcePathL, version):
+        """Import data stored by exportSideCache() if these were stored with the input layout version and
+        derived from the current source files (as identified by file modification time and size).
+
+        Args:
+            filePath (str): side cache (pickle) file path
+            sourcePathL (list): paths to the source files from which the data are derived
+            version (int): layout version of the stored data
+
+        Returns:
+            (object): stored data or None if the side cache is missing or out of date
+        """
+        try:
+            if not os.path.exists(filePath):
+                return None
+            sD = self.importPickle(filePath)
+            if not sD or sD.get("version") != version or sD.get("source") != self.__getSourceSignature(sourcePathL):
+                logger.info("Side cache %s is out of date", filePath)
+                return None
+            logger.info("Reading side cache %s", filePath)
+            return sD["data"]
+        except Exception as e:
+            logger.warning("Failing for %r with %s", filePath, str(e))
+        return None
+
+    def exportSideCache(self, filePath, sourcePathL, version, data):
+        """Export data derived from the input source files as a side cache for importSideCache().
+
+        Args:
+            filePath (str): side cache (pickle) file path
+            sourcePathL (list): paths to the source files from which the data are derived
+            version (int): layout version of the stored data
+            data (object): data to store
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        try:
+            sD = {"version": version, "source": self.__getSourceSignature(sourcePathL), "data": data}
+        except Exception as e:
+            logger.warning("Failing for %r with %s", filePath, str(e))
+            return False
+        return self.exportPickle(filePath, sD)
+
+    def __getSourceSignature(self, sourcePathL):
+        return [(st.st_mtime_ns, st.st_size) for st in (os.stat(pth) for pth in sourcePathL)]
+
+    def importPickle(self, filePath):
+        """Import pickled data.
+
+        Args:
+            filePath (str): pickle file path
+
+        Returns:
+            (object): unpickled data or an empty dictionary on failure
+        """
+        try:
+            with open(filePath, "rb") as ifh:
+                return pickle.load(ifh)
+        except Exception as e:
+            logger.warning("Failing for %r with %s", filePath, str(e))
+        return {}
+
+    def exportPickle(self, filePath, obj):
+        """Export data as a pickle (highest protocol), replacing any existing file atomically.
+
+        Args:
+            filePath (str): pickle file path
+            obj (object): data to pickle
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        try:
+            tmpPath = filePath + ".tmp"
+            with open(tmpPath, "wb") as ofh:
+                pickle.dump(obj, ofh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmpPath, filePath)
+            return True
+        except Exception as e:
+            logger.warning("Failing for %r with %s", filePath, str(e))
+        return False
+
+    def __loads(self, data):
+        return orjson.loads(data) if orjson else json.loads(data)
+
+    def __readBytes(self, fp):
+        with open(fp, "rb") as ifh:
+            return ifh.read()
+
+    def __readGzipBytes(self, fp):
+        """Return the decompressed content of the input gzipped file. The output buffer is presized from
+        the uncompressed length recorded in the gzip trailer (ISIZE) to avoid repeated reallocation, provided
+        that this length is plausible for the compressed size (a corrupt trailer may record any length).
+
+        Args:
+            fp (str): gzipped file path
+
+        Returns:
+            (bytes): decompressed file content
+        """
+        data = self.__readBytes(fp)
+        isize = int.from_bytes(data[-4:], "little") if len(data) >= 18 else 0
+        if 0 < isize <= _MAX_PRESIZE_RATIO * len(data):
+            try:
+                # wbits=31 selects the gzip container; ISIZE is the uncompressed length modulo 2**32
+                rB = zlib.decompress(data, 31, isize)
+                if len(rB) & 0xFFFFFFFF == isize:
+                    return rB
+            except zlib.error:
+                pass
+        # Incrementally grown output - zlib.decompress() also stops after the first member of a multi-member gzip file
+        return gzip.decompress(data)
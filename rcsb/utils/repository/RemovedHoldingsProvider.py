@@ -9,19 +9,54 @@
 ##
 """Provide an inventory of removed repository content.
 """
+import collections
+import collections.abc
+import datetime
+import functools
 import logging
 import os.path
 
 import dateutil.parser
-from rcsb.utils.io.FileUtil import FileUtil
-from rcsb.utils.io.MarshalUtil import MarshalUtil
+from rcsb.utils.repository.HoldingsFileUtil import HoldingsFileUtil, truncateDate
 
 logger = logging.getLogger(__name__)
 
 
+# Layout version of the preprocessed removed holdings side cache (increment when the stored structures change)
+_SIDE_CACHE_VERSION = 3
+# Content types that may hold model (insilico) coordinates
+_MODEL_CONTENT_TYPES = frozenset(["pdb", "mmcif", "pdbml"])
+# Attribute handling kinds for removed record mapping
+_OTHER_ATTRIBUTE, _DATE_ATTRIBUTE, _REPLACED_BY_ATTRIBUTE, _CONTENT_TYPE_ATTRIBUTE = range(4)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parseDate(dateString):
+    """Return the datetime for the input (ISO format) date string. Results are cached since
+    dates repeat heavily across entries (e.g., release dates)."""
+    try:
+        return datetime.datetime.fromisoformat(dateString)
+    except ValueError:
+        return dateutil.parser.parse(dateString)
+
+
 class RemovedHoldingsProvider(object):
     """Provide an inventory of removed repository content."""
 
+    __slots__ = (
+        "__cachePath",
+        "__dirPath",
+        "__storeCache",
+        "__filterType",
+        "__assignDates",
+        "__hfU",
+        "__invD",
+        "__replacedByD",
+        "__supersededByCacheD",
+        "__entryIdByStatusD",
+        "__allContentTypes",
+    )
+
     def __init__(self, cachePath, useCache=False, **kwargs):
         self.__cachePath = cachePath
         self.__dirPath = os.path.join(self.__cachePath, "holdings")
@@ -34,8 +69,41 @@ class RemovedHoldingsProvider(object):
         urlTarget = os.path.join(baseUrl, "all_removed_entries.json.gz")
         urlFallbackTarget = os.path.join(fallbackUrl, "all_removed_entries.json.gz")
         #
-        self.__mU = MarshalUtil(workPath=self.__dirPath)
-        self.__invD = self.__reload(urlTarget, urlFallbackTarget, self.__dirPath, useCache=useCache)
+        self.__hfU = HoldingsFileUtil(workPath=self.__dirPath)
+        self.__supersededByCacheD = {}
+        #
+        # The inventory and its derived indices are stored in a pickle side cache keyed on the cached holdings file
+        sD = None
+        fp = None
+        sideCachePath = os.path.join(self.__dirPath, "removed_holdings_preprocessed.pic")
+        if self.__storeCache:
+            fp = self.__hfU.syncCache(urlTarget, urlFallbackTarget, self.__dirPath, useCache=useCache)
+            sD = self.__hfU.importSideCache(sideCachePath, [fp], _SIDE_CACHE_VERSION) if fp else None
+            # The cached holdings file is now current
+            useCache = True
+        if sD:
+            self.__invD = sD["invD"]
+            self.__replacedByD = sD["replacedByD"]
+            self.__entryIdByStatusD = sD["entryIdByStatusD"]
+            self.__allContentTypes = sD["allContentTypes"]
+        else:
+            self.__invD = self.__reload(urlTarget, urlFallbackTarget, self.__dirPath, useCache=useCache)
+            # Superseding entry identifiers normalized to upper case tuples {entryId: (entryId, ...), ...}
+            self.__replacedByD = self.__buildReplacedByIndex(self.__invD)
+            # Status code and content type indices {status_code: [entryId, ...], ...}
+            self.__entryIdByStatusD = {}
+            for entryId, tD in self.__invD.items():
+                self.__entryIdByStatusD.setdefault(tD.get("status_code"), []).append(entryId)
+            self.__allContentTypes = sorted(set().union(*(tD["content_type"].keys() for tD in self.__invD.values() if "content_type" in tD)))
+            if fp and self.__invD:
+                sD = {
+                    "invD": self.__invD,
+                    "replacedByD": self.__replacedByD,
+                    "entryIdByStatusD": self.__entryIdByStatusD,
+                    "allContentTypes": self.__allContentTypes,
+                }
+                ok = self.__hfU.exportSideCache(sideCachePath, [fp], _SIDE_CACHE_VERSION, sD)
+                logger.info("Stored preprocessed removed holdings in %s (%r)", sideCachePath, ok)
 
     def testCache(self, minCount=1000):
         logger.info("Inventory length cD (%d)", len(self.__invD))
@@ -43,135 +111,98 @@ class RemovedHoldingsProvider(object):
             return True
         return False
 
+    def __getEntry(self, entryId):
+        # Inventory keys are canonical upper case identifiers; other forms are normalized only on a miss
+        if not isinstance(entryId, str):
+            logger.error("Failing for unexpected entry identifier %r", entryId)
+            return {}
+        tD = self.__invD.get(entryId)
+        return tD if tD is not None else self.__invD.get(entryId.upper(), {})
+
     def getStatusCode(self, entryId):
         """Return the status code for the removed entry"""
-        try:
-            return self.__invD[entryId.upper()]["status_code"]
-        except Exception as e:
-            logger.debug("Failing for %r with %s", entryId, str(e))
-        return None
+        return self.__getEntry(entryId).get("status_code")
 
     def getSupersededBy(self, entryId):
-        """Return the superseding entry ids"""
-        try:
+        """Return the superseding entry ids (direct successors first, followed by their successors, breadth first)"""
+        if not isinstance(entryId, str):
+            logger.debug("Failing for unexpected entry identifier %r", entryId)
+            return []
+        eId = entryId if entryId in self.__invD else entryId.upper()
+        sL = self.__supersededByCacheD.get(eId)
+        if sL is None:
             sL = []
-            if isinstance(self.__invD[entryId.upper()]["superseded_by"], str):
-                sL = [self.__invD[entryId.upper()]["superseded_by"]]
-            else:
-                sL = self.__invD[entryId.upper()]["superseded_by"]
-            if len(sL) > 0:
-                for recursiveEntry in sL:
-                    if isinstance(self.__invD[recursiveEntry.upper()]["superseded_by"], str):
-                        sL = sL + [self.__invD[recursiveEntry.upper()]["superseded_by"]]
-                    elif isinstance(self.__invD[recursiveEntry.upper()]["superseded_by"], list):
-                        sL = sL + self.__invD[recursiveEntry.upper()]["superseded_by"]
-                    else:
-                        break
-        except Exception as e:
-            logger.debug("Failing for %r with %s", entryId, str(e))
-        return sL
+            seenS = {eId}
+            queue = collections.deque([eId])
+            while queue:
+                for sId in self.__replacedByD.get(queue.popleft(), ()):
+                    if sId not in seenS:
+                        seenS.add(sId)
+                        sL.append(sId)
+                        queue.append(sId)
+            self.__supersededByCacheD[eId] = sL
+        return list(sL)
 
     def getRemovedEntries(self):
         return list(self.__invD.keys())
 
     def getEntryByStatus(self, statusCode):
         """Return the entry codes for removed entries with the input status code"""
-        try:
-            return [entryId for entryId, vD in self.__invD.items() if "status_code" in vD and vD["status_code"] == statusCode]
-        except Exception as e:
-            logger.debug("Failing for %r with %s", statusCode, str(e))
-        return []
+        return list(self.__entryIdByStatusD.get(statusCode, ()))
 
     def getRemovedInfo(self, entryId):
         """Return the dictionary describing the details for this removed entry"""
-        try:
-            return self.__invD[entryId.upper()]
-        except Exception as e:
-            logger.debug("Failing for %r with %s", entryId, str(e))
-        return {}
+        return self.__getEntry(entryId)
 
     def getContentTypes(self, entryId):
         """Return the removed content types for the input entry identifier"""
-        try:
-            return sorted(self.__invD[entryId.upper()]["content_type"].keys())
-        except Exception as e:
-            logger.debug("Failing for %r with %s", entryId, str(e))
-        return []
+        return sorted(self.__getEntry(entryId).get("content_type", {}))
 
     def getContentTypePathList(self, entryId, contentType):
         """Return the removed content types for the input entry identifier"""
-        try:
-            return (
-                self.__invD[entryId.upper()]["content_type"][contentType]
-                if isinstance(self.__invD[entryId.upper()]["content_type"][contentType], list)
-                else [self.__invD[entryId.upper()]["content_type"][contentType]]
-            )
-        except Exception as e:
-            logger.debug("Failing for %r %r with %s", entryId, contentType, str(e))
-        return []
+        pthL = self.__getEntry(entryId).get("content_type", {}).get(contentType)
+        return pthL if isinstance(pthL, list) else [pthL] if pthL else []
 
     def getInventory(self):
         """Return the removed inventory dictionary"""
-        try:
-            return self.__invD
-        except Exception as e:
-            logger.debug("Failing with %s", str(e))
-        return {}
+        return self.__invD
 
     def getAllContentTypes(self):
         """Return the removed content types for the input entry identifier"""
-        entryId = None
-        try:
-            cS = set()
-            for entryId, tD in self.__invD.items():
-                if "content_type" in tD:
-                    for cT in tD["content_type"].keys():
-                        cS.add(cT)
-            return sorted(list(cS))
-        except Exception as e:
-            logger.exception("Failing for %r with %s", entryId, str(e))
-        return []
+        return list(self.__allContentTypes)
 
     def __reload(self, urlTarget, urlFallbackTarget, dirPath, useCache=True):
-        invD = {}
-        fU = FileUtil()
-        fn = fU.getFileName(urlTarget)
-        fp = os.path.join(dirPath, fn)
-        self.__mU.mkdir(dirPath)
-        #
-        if self.__storeCache and useCache and self.__mU.exists(fp):
-            invD = self.__mU.doImport(fp, fmt="json")
-            logger.info("Reading cached inventory (%d) from file %s", len(invD), fp)
-        else:
-            invD = self.__mU.doImport(urlTarget, fmt="json")
-            logger.info("Loaded inventory from %s (%r)", urlTarget, len(invD))
-            if len(invD) == 0:
-                invD = self.__mU.doImport(urlFallbackTarget, fmt="json")
-                logger.info("Loaded fallback inventory from %s (%r)", urlFallbackTarget, len(invD))
-        #
-        if self.__storeCache:
-            logger.info("Fetch inventory from %s", urlTarget)
-            ok = fU.get(urlTarget, fp)
-            if not ok:
-                ok = fU.get(urlFallbackTarget, fp)
-        #
-        return invD
+        invD = self.__hfU.reload(urlTarget, urlFallbackTarget, dirPath, storeCache=self.__storeCache, useCache=useCache)
+        logger.info("Removed inventory (%d)", len(invD))
+        # Canonicalize entry identifiers and superseding entry identifiers to upper case once at load
+        rD = {}
+        for entryId, tD in invD.items():
+            if "superseded_by" in tD:
+                sbL = tD["superseded_by"]
+                tD["superseded_by"] = (sbL.upper(),) if isinstance(sbL, str) else tuple(t.upper() for t in sbL or ())
+            rD[entryId if entryId.isupper() else entryId.upper()] = tD
+        return rD
+
+    def __buildReplacedByIndex(self, invD):
+        # Superseding entry identifiers are normalized to upper case tuples in __reload()
+        return {entryId: tD["superseded_by"] for entryId, tD in invD.items() if "superseded_by" in tD}
 
     def getStatusDetails(self, curD):
+        # Membership tests against curD are constant time only for mappings and sets
+        curKeys = curD if isinstance(curD, (collections.abc.Mapping, collections.abc.Set)) else set(curD)
         rmD = {}
         for entryId, tD in self.__invD.items():
-            if entryId in curD:
+            if entryId in curKeys:
                 continue
             #
-            if tD["status_code"] == "TRSF":
+            statusCode = tD["status_code"]
+            if statusCode == "TRSF":
                 rmD[entryId] = {"status": "REMOVED", "status_code": "TRSF"}
-            elif tD["status_code"] == "OBS":
+            elif statusCode == "OBS":
                 sL = self.getSupersededBy(entryId)
-                if sL:
-                    if sL[-1] in curD:
-                        rmD[entryId] = {"status": "REMOVED", "status_code": "OBS", "id_code_replaced_by_latest": sL[-1]}
-                    else:
-                        rmD[entryId] = {"status": "REMOVED", "status_code": "OBS"}
+                latestId = sL[-1] if sL else None
+                if latestId and latestId in curKeys:
+                    rmD[entryId] = {"status": "REMOVED", "status_code": "OBS", "id_code_replaced_by_latest": latestId}
                 else:
                     rmD[entryId] = {"status": "REMOVED", "status_code": "OBS"}
         return rmD
@@ -250,115 +281,95 @@ class RemovedHoldingsProvider(object):
             "content_type": "repository_content_types",
             "title": "title",
         }
-        dateFields = ["deposit_date", "release_date", "remove_date"]
+        dateFieldS = frozenset(["deposit_date", "release_date", "remove_date"])
+        insilicoStatusS = frozenset(["OBS", "TRSF", "WDRN"])
+        mapTransferred = self.__makeRecordMapper(trMapD, ct1MapD, dateFieldS)
+        mapRemoved = self.__makeRecordMapper(removedMapD, ct2MapD, dateFieldS)
+        mapInsilico = self.__makeRecordMapper(insMapD, None, dateFieldS)
         trsfD = {}
         insilicoD = {}
         auditAuthorD = {}
         removedD = {}
-        superD = {}
-        # --- generate lookup for superseding entries ---
-        replacedByD = {}
+        # {superseding entryId: [superseded entryId, ...], ...}
         replacesD = {}
+        # --- single pass over the inventory
         for entryId, tD in invD.items():
-            if "superseded_by" in tD:
-                if isinstance(tD["superseded_by"], str):
-                    replacedByD[entryId] = [tD["superseded_by"].upper()]
-                else:
-                    replacedByD[entryId] = [t.upper() for t in tD["superseded_by"]]
-        for entryId, rIdL in replacedByD.items():
-            for rId in rIdL:
-                replacesD.setdefault(rId, []).append(entryId)
-        # ---
-        for entryId, tD in invD.items():
-            # --- Transferred ---
-            if tD["status_code"] == "TRSF":
-                qD = {}
-                for iky, oky in trMapD.items():
-                    if iky not in tD:
-                        continue
-                    if self.__assignDates and oky in dateFields:
-                        qD[oky] = dateutil.parser.parse(tD[iky])
-                    elif oky in dateFields:
-                        qD[oky] = tD[iky][:10]
-                    else:
-                        qD[oky] = tD[iky]
-                    #
-                    if iky == "content_type":
-                        cS = set()
-                        for ct in tD["content_type"]:
-                            if ct in ct1MapD:
-                                cS.add(ct1MapD[ct])
-                        qD["repository_content_types"] = sorted(list(cS))
-                    #
-                    if oky == "id_codes_replaced_by":
-                        if isinstance(qD["id_codes_replaced_by"], str):
-                            qD["id_codes_replaced_by"] = [qD["id_codes_replaced_by"].upper()]
-                        else:
-                            qD["id_codes_replaced_by"] = [t.upper() for t in qD["id_codes_replaced_by"]]
-                trsfD[entryId] = qD
+            statusCode = tD["status_code"]
+            if statusCode == "TRSF":
+                # --- Transferred ---
+                trsfD[entryId] = mapTransferred(tD)
             else:
                 # --- removed ---
-                qD = {}
-                for iky, oky in removedMapD.items():
-                    if iky not in tD:
-                        continue
-                    if self.__assignDates and oky in dateFields:
-                        qD[oky] = dateutil.parser.parse(tD[iky])
-                    elif oky in dateFields:
-                        qD[oky] = tD[iky][:10]
-                    else:
-                        qD[oky] = tD[iky]
-                    #
-                    if iky == "content_type":
-                        cS = set()
-                        for ct in tD["content_type"]:
-                            if ct in ct2MapD:
-                                cS.add(ct2MapD[ct])
-                        qD["repository_content_types"] = sorted(list(cS))
-                    #
-                    if oky == "id_codes_replaced_by":
-                        if isinstance(qD["id_codes_replaced_by"], str):
-                            qD["id_codes_replaced_by"] = [qD["id_codes_replaced_by"].upper()]
-                        else:
-                            qD["id_codes_replaced_by"] = [t.upper() for t in qD["id_codes_replaced_by"]]
-                    #
-                removedD[entryId] = qD
+                removedD[entryId] = mapRemoved(tD)
             #
             # --- inslico models
-            if tD["status_code"] in ["OBS", "TRSF", "WDRN"] and self.__isContentInsilico(tD["content_type"]):
-                qD = {}
-                for iky, oky in insMapD.items():
-                    if iky not in tD:
-                        continue
-                    # yyyy-mm-dd
-                    if self.__assignDates and oky in dateFields:
-                        qD[oky] = dateutil.parser.parse(tD[iky])
-                    elif oky in dateFields:
-                        qD[oky] = tD[iky][:10]
-                    else:
-                        qD[oky] = tD[iky]
-                    if oky == "id_codes_replaced_by":
-                        if isinstance(qD["id_codes_replaced_by"], str):
-                            qD["id_codes_replaced_by"] = [qD["id_codes_replaced_by"].upper()]
-                        else:
-                            qD["id_codes_replaced_by"] = [t.upper() for t in qD["id_codes_replaced_by"]]
-                #
-                insilicoD[entryId] = qD
+            if statusCode in insilicoStatusS and self.__isContentInsilico(tD["content_type"]):
+                insilicoD[entryId] = mapInsilico(tD)
             # --- audit authors ---
             if "deposition_authors" in tD:
-                qL = []
-                for ii, author in enumerate(tD["deposition_authors"], 1):
-                    qL.append({"ordinal_id": ii, "audit_author": author})
-                auditAuthorD[entryId] = qL
-
-            #  ---- superseded ----
-            if entryId in replacesD:
-                superD[entryId] = {"id_codes_superseded": replacesD[entryId]}
+                auditAuthorD[entryId] = [{"ordinal_id": ii, "audit_author": author} for ii, author in enumerate(tD["deposition_authors"], 1)]
+            # --- superseding entries (normalized to upper case tuples on load) ---
+            for rId in tD.get("superseded_by", ()):
+                replacesD.setdefault(rId, []).append(entryId)
+        #  ---- superseded ----
+        superD = {rId: {"id_codes_superseded": eIdL} for rId, eIdL in replacesD.items() if rId in invD}
         logger.info("# of transferred entries: %d", len(trsfD))
         logger.info("# of insilico entries: %d", len(insilicoD))
         logger.info("# of removed entries: %d", len(removedD))
         return trsfD, insilicoD, auditAuthorD, removedD, superD
 
+    def __makeRecordMapper(self, mapD, ctMapD, dateFieldS):
+        """Return a function mapping a removed inventory record to RCSB attribute names. The per-attribute
+        handling is resolved once here rather than for each record.
+
+        Args:
+            mapD (dict): {inventory attribute: output attribute, ...}
+            ctMapD (dict): mapping of inventory content types to RCSB content types (None to copy content types as is)
+            dateFieldS (frozenset): output attributes holding dates (yyyy-mm-dd)
+
+        Returns:
+            (function): mapper f(tD) -> dict
+        """
+        dateFunc = _parseDate if self.__assignDates else truncateDate
+        planL = []
+        for iky, oky in mapD.items():
+            if oky in dateFieldS:
+                planL.append((iky, oky, _DATE_ATTRIBUTE))
+            elif oky == "id_codes_replaced_by":
+                planL.append((iky, oky, _REPLACED_BY_ATTRIBUTE))
+            elif iky == "content_type" and ctMapD is not None:
+                planL.append((iky, oky, _CONTENT_TYPE_ATTRIBUTE))
+            else:
+                planL.append((iky, oky, _OTHER_ATTRIBUTE))
+        planT = tuple(planL)
+        # Mapped content types are shared by many records, so these are pooled on the set of inventory content types
+        contentTypeCacheD = {}
+
+        def mapContentTypes(ctD):
+            ctKey = frozenset(ctD)
+            ctT = contentTypeCacheD.get(ctKey)
+            if ctT is None:
+                ctT = tuple(sorted({ctMapD[ct] for ct in ctKey if ct in ctMapD}))
+                contentTypeCacheD[ctKey] = ctT
+            return list(ctT)
+
+        def mapRecord(tD):
+            qD = {}
+            for iky, oky, attributeKind in planT:
+                if iky not in tD:
+                    continue
+                if attributeKind == _OTHER_ATTRIBUTE:
+                    qD[oky] = tD[iky]
+                elif attributeKind == _DATE_ATTRIBUTE:
+                    qD[oky] = dateFunc(tD[iky])
+                elif attributeKind == _REPLACED_BY_ATTRIBUTE:
+                    qD[oky] = list(tD[iky])
+                else:
+                    qD[oky] = mapContentTypes(tD[iky])
+            return qD
+
+        return mapRecord
+
     def __isContentInsilico(self, ctD):
         """Test if the content type dictionary contains an inslico model.
 
@@ -376,11 +387,4 @@ class RemovedHoldingsProvider(object):
                     ]
                 },
         """
-        isModel = False
-        for ct, pthL in ctD.items():
-            if ct in ["pdb", "mmcif", "pdbml"]:
-                for pth in pthL:
-                    if pth.startswith("/pdb/data/structures/models"):
-                        isModel = True
-                        break
-        return isModel
+        return any(pth.startswith("/pdb/data/structures/models") for ct, pthL in ctD.items() if ct in _MODEL_CONTENT_TYPES for pth in pthL)
@@ -43,7 +43,12 @@ __author__ = "John Westbrook"
 __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2.0"
 
+import collections.abc
+import concurrent.futures
+import functools
 import logging
+import multiprocessing
+import operator
 import os
 import time
 
@@ -58,6 +63,194 @@ from rcsb.utils.validation.ValidationReportAdapter import ValidationReportAdapte
 logger = logging.getLogger(__name__)
 
 
+def _scanRepoPaths(topPath, nameFilter):
+    """Yield the paths of the files in the input directory tree with names accepted by the input filter,
+    skipping directories with paths containing "REMOVE". Directory entry types are taken from os.scandir()
+    so that no additional stat() calls are made for regular repository files.
+
+    Args:
+        topPath (str): top directory path
+        nameFilter (function): f(fileName) -> bool selecting the files to return
+
+    Yields:
+        (str): file path
+    """
+    topPath = os.fspath(topPath)
+    if "REMOVE" in topPath:
+        return
+    # An explicit stack of directories (in place of recursion) keeps the traversal order of os.walk(topdown=True)
+    dirStack = [topPath]
+    while dirStack:
+        dirPath = dirStack.pop()
+        try:
+            it = os.scandir(dirPath)
+        except OSError:
+            continue
+        subDirL = []
+        with it:
+            for entry in it:
+                try:
+                    isDir = entry.is_dir()
+                except OSError:
+                    isDir = False
+                if isDir:
+                    # REMOVE subtrees are pruned here, and symbolic links to directories are not followed (as os.walk())
+                    if "REMOVE" not in entry.name and not entry.is_symlink():
+                        subDirL.append(entry.path)
+                elif nameFilter(entry.name):
+                    yield entry.path
+        dirStack.extend(reversed(subDirL))
+
+
+def _orderPathsByIdNumber(pathIt, idNumberFunc):
+    """Return the input file paths ordered by the numeric identifier taken from each file name, keeping
+    the last path found for any repeated identifier.
+
+    Args:
+        pathIt (iterable): file paths
+        idNumberFunc (function): f(fileName) -> int numeric identifier
+
+    Returns:
+        (list): ordered file paths
+    """
+    # The sort is stable, so the last path in each run of equal identifiers is the last one found
+    tupL = sorted(((idNumberFunc(os.path.basename(pth)), pth) for pth in pathIt), key=operator.itemgetter(0))
+    return [pth for ii, (idNumber, pth) in enumerate(tupL, 1) if ii == len(tupL) or tupL[ii][0] != idNumber]
+
+
+# Hash directory names of the chemical component and entry repositories
+_CHEM_COMP_HASH_DIR_NAMES = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+_ENTRY_HASH_DIR_NAMES = frozenset(a1 + a2 for a1 in "abcdefghijklmnopqrstuvwxyz0123456789" for a2 in "abcdefghijklmnopqrstuvwxyz0123456789")
+
+
+def _listHashDirNames(topPath, nameSet):
+    """Return the sorted names of the existing subdirectories of topPath that are included in nameSet,
+    so that only the hash directories actually present in a repository are scanned.
+
+    Args:
+        topPath (str): repository top path
+        nameSet (set): hash directory names
+
+    Returns:
+        (list): subdirectory names
+    """
+    try:
+        with os.scandir(topPath) as it:
+            return sorted(entry.name for entry in it if entry.name in nameSet and entry.is_dir())
+    except OSError:
+        return []
+
+
+def _isEntryFileName(name):
+    """Test for PDB entry file names (e.g., 1abc.cif.gz or 1abc.cif)."""
+    # The length test comes first as it rejects most other file names (e.g., validation reports) cheaply
+    nameLen = len(name)
+    return (nameLen == 11 and name[-7:] == ".cif.gz") or (nameLen == 8 and name[-4:] == ".cif")
+
+
+def _isChemCompFileName(name):
+    """Test for chemical component definition file names (e.g., ATP.cif)."""
+    return len(name) <= 7 and name[-4:] == ".cif"
+
+
+def _getFileNameStem(fileName):
+    """Return the file name up to the first period (e.g., 1abc.cif.gz -> 1abc)."""
+    return fileName.partition(".")[0]
+
+
+def _getIhmFileNameIdCode(fileName):
+    """Return the identifier for I/HM file names (e.g., PDBDEV_00000001_model_v1-0.cif.gz -> PDBDEV_00000001)."""
+    return "_".join(fileName.partition(".")[0].split("_", 2)[:2])
+
+
+def _getVrptFileNameIdCode(fileName):
+    """Return the identifier for validation report file names (e.g., 1abc_validation.xml.gz -> 1abc)."""
+    return fileName.partition(".")[0].partition("_")[0]
+
+
+# Locator file name identifier parsers by content type (None for content types without identifiers)
+_ID_CODE_FILE_NAME_PARSERS = {
+    **dict.fromkeys(["pdbx", "pdbx_core", "pdbx_obsolete", "bird", "bird_family", "chem_comp", "chem_comp_core", "bird_consolidated", "bird_chem_comp_core"], _getFileNameStem),
+    **dict.fromkeys(["ihm_dev", "ihm_dev_core", "ihm_dev_full"], _getIhmFileNameIdCode),
+    **dict.fromkeys(["pdb_distro", "da_internal", "status_history"], None),
+    "vrpt": _getVrptFileNameIdCode,
+}
+
+
+# Configuration keys for local repository top paths by content type (None for content types without repository paths)
+_REPO_PATH_CONFIG_KEYS = {
+    "bird": "BIRD_REPO_PATH",
+    "bird_family": "BIRD_FAMILY_REPO_PATH",
+    "chem_comp": "CHEM_COMP_REPO_PATH",
+    "chem_comp_core": "CHEM_COMP_REPO_PATH",
+    "bird_chem_comp": "BIRD_CHEM_COMP_REPO_PATH",
+    "pdbx": "PDBX_REPO_PATH",
+    "pdbx_core": "PDBX_REPO_PATH",
+    "pdbx_obsolete": "PDBX_OBSOLETE_REPO_PATH",
+    "pdbx_comp_model_core": "PDBX_COMP_MODEL_REPO_PATH",
+    "ihm_dev": "IHM_DEV_REPO_PATH",
+    "ihm_dev_core": "IHM_DEV_REPO_PATH",
+    "ihm_dev_full": "IHM_DEV_REPO_PATH",
+    "pdb_distro": None,
+    "da_internal": None,
+    "status_history": None,
+}
+
+
+def _joinUrl(baseUrl, *parts):
+    """Return the URL formed by appending the input path parts to baseUrl with "/" separators."""
+    return "/".join((baseUrl.rstrip("/"),) + parts) if baseUrl else "/".join(parts)
+
+
+# Local locator paths relative to the repository top path by content type f(idCode, version) -> str
+# (None for content types without per-identifier locators)
+_LOCAL_LOCATOR_TEMPLATES = {
+    **dict.fromkeys(["pdbx", "pdbx_core", "pdbx_obsolete"], lambda idCode, version: f"{idCode.lower()[1:3]}/{idCode.lower()}.cif.gz"),
+    "vrpt": lambda idCode, version: f"{idCode.lower()[1:3]}/{idCode.lower()}/{idCode.lower()}_validation.xml.gz",
+    **dict.fromkeys(["bird", "bird_family", "bird_chem_comp"], lambda idCode, version: f"{idCode[-1]}/{idCode}.cif"),
+    **dict.fromkeys(["chem_comp", "chem_comp_core"], lambda idCode, version: f"{idCode[0]}/{idCode}/{idCode}.cif"),
+    **dict.fromkeys(["bird_consolidated", "bird_chem_comp_core"], lambda idCode, version: f"{idCode}.cif"),
+    **dict.fromkeys(["ihm_dev", "ihm_dev_core", "ihm_dev_full"], lambda idCode, version: f"{idCode}/{idCode}_model_{version}.cif.gz"),
+    **dict.fromkeys(["pdb_distro", "da_internal", "status_history"], None),
+}
+
+# Content types supported in local discovery mode
+_LOCAL_CONTENT_TYPES = frozenset(
+    [
+        "bird",
+        "bird_core",
+        "bird_family",
+        "chem_comp",
+        "bird_chem_comp",
+        "pdbx",
+        "pdbx_core",
+        "pdbx_obsolete",
+        "chem_comp_core",
+        "bird_consolidated",
+        "bird_chem_comp_core",
+        "ihm_dev",
+        "ihm_dev_core",
+        "ihm_dev_full",
+        "pdb_distro",
+        "da_internal",
+        "status_history",
+        "pdbx_comp_model_core",
+    ]
+)
+
+# Content types with local repository paths that follow directly from the identifier {content type: locator content type, ...}
+_LOCAL_ID_CODE_CONTENT_TYPES = {
+    "bird": "bird",
+    "bird_core": "bird",
+    "bird_family": "bird_family",
+    "chem_comp": "chem_comp",
+    "bird_chem_comp": "bird_chem_comp",
+    "pdbx": "pdbx",
+    "pdbx_core": "pdbx_core",
+    "pdbx_obsolete": "pdbx_obsolete",
+}
+
+
 def toCifWrapper(xrt):
     dirPath = os.environ.get("_RP_DICT_PATH_")
     vpr = ValidationReportAdapter(dirPath=dirPath, useCache=True)
@@ -65,6 +258,42 @@ def toCifWrapper(xrt):
     return vrd.toCif(xrt)
 
 
+# Minimum number of items (e.g., locator objects or reference data files) read in parallel by worker processes
+_MIN_PARALLEL_READ_COUNT = 32
+
+# One-letter codes for the standard (and ambiguous) amino acid residues
+_AA_ONE_LETTER_CODE_D = {
+    "ALA": "A",
+    "ARG": "R",
+    "ASN": "N",
+    "ASP": "D",
+    "ASX": "B",
+    "CYS": "C",
+    "GLN": "Q",
+    "GLU": "E",
+    "GLX": "Z",
+    "GLY": "G",
+    "HIS": "H",
+    "ILE": "I",
+    "LEU": "L",
+    "LYS": "K",
+    "MET": "M",
+    "PHE": "F",
+    "PRO": "P",
+    "SER": "S",
+    "THR": "T",
+    "TRP": "W",
+    "TYR": "Y",
+    "VAL": "V",
+    "PYL": "O",
+    "SEC": "U",
+}
+
+# Shared (read-only) locator keyword arguments for primary files and validation report files
+_EMPTY_KW = HashableDict({})
+_VRPT_KW = HashableDict({"marshalHelper": toCifWrapper})
+
+
 class RepositoryProvider(object):
     """Utilities for scanning and accessing data in PDBx/mmCIF data in common repository file systems or via remote repository services.
 
@@ -95,11 +324,11 @@ class RepositoryProvider(object):
         self.__edMapUrl = self.__cfgOb.getPath("RCSB_EDMAP_LIST_PATH", sectionName=self.__configName, default=None)
         #
         self.__kwD = {
-            "holdingsTargetUrl": os.path.join(self.__baseUrlPDB, "pdb", "holdings"),
-            "holdingsFallbackUrl": os.path.join(self.__fallbackUrlPDB, "pdb", "holdings"),
+            "holdingsTargetUrl": _joinUrl(self.__baseUrlPDB, "pdb", "holdings"),
+            "holdingsFallbackUrl": _joinUrl(self.__fallbackUrlPDB, "pdb", "holdings"),
             "edmapsLocator": self.__edMapUrl,
-            "updateTargetUrl": os.path.join(self.__baseUrlPDB, "pdb", "data", "status", "latest"),
-            "updateFallbackUrl": os.path.join(self.__fallbackUrlPDB, "pdb", "data", "status", "latest"),
+            "updateTargetUrl": _joinUrl(self.__baseUrlPDB, "pdb", "data", "status", "latest"),
+            "updateFallbackUrl": _joinUrl(self.__fallbackUrlPDB, "pdb", "data", "status", "latest"),
             "filterType": "assign-dates",
         }
         #
@@ -110,19 +339,42 @@ class RepositoryProvider(object):
         self.__fU = FileUtil(workPath=self.__cachePath)
         self.__chP = None
         self.__rhP = None
+        # Identifier sets for selecting input identifier lists {<holdings identifier list name>: frozenset(), ...}
+        self.__idCodeSetD = {}
+        # Local repository scan results {(scan method name, repository top path): [path, ...], ...}
+        self.__scanCacheD = {}
+        # Reference data indices built from the BIRD and chemical component repositories
+        self.__familyIndexCache = None
+        self.__birdCcIndexCacheD = {}
+        # Repository top paths and path prefixes (with trailing separator) used to build per-identifier locators
+        self.__repoLocalPathD = {}
+        self.__localPrefixD = {}
+        # Remote prefixes are assembled once with "/" separators, independent of the local path conventions
+        self.__remotePrefixD = {
+            "bird": _joinUrl(self.__baseUrlPDB, "pdb", "refdata", "bird", "prd", ""),
+            "bird_family": _joinUrl(self.__baseUrlPDB, "pdb", "refdata", "bird", "family", ""),
+            "bird_chem_comp": _joinUrl(self.__baseUrlPDB, "pdb", "refdata", "bird", "prdcc", ""),
+            "chem_comp": _joinUrl(self.__baseUrlPDB, "pdb", "refdata", "chem_comp", ""),
+            "pdbx": _joinUrl(self.__baseUrlPDB, "pdb", "data", "structures", "divided", "mmCIF", ""),
+            "vrpt": _joinUrl(self.__baseUrlPDB, "pdb", "validation_reports", ""),
+            "pdbx_obsolete": _joinUrl(self.__baseUrlPDB, "pdb", "data", "structures", "obsolete", "mmCIF", ""),
+            "ihm_dev": _joinUrl(self.__baseUrlPDBDev, "cif", ""),
+        }
         logger.info("Discovery mode is %r", self.__discoveryMode)
         #
 
-    def getLocatorObjList(self, contentType, inputPathList=None, inputIdCodeList=None, mergeContentTypes=None, excludeIds=None):
+    def getLocatorObjList(self, contentType, inputPathList=None, inputIdCodeList=None, mergeContentTypes=None, excludeIds=None, sortResults=True):
         """Convenience method to get the data path list for the input repository content type.
 
         Args:
             contentType (str): Repository content type (e.g. pdbx, chem_comp, bird, ...)
             inputPathList (list, optional): path list that will be returned if provided (discoveryMode=local).
-            inputIdCodeList (list, optional): locators will be returned for this ID code list (discoveryMode=remote).
+            inputIdCodeList (list, optional): locators will be returned for this ID code list (discoveryMode=remote, and
+                                discoveryMode=local for entry, BIRD and chemical component content types).
             mergeContentTypes (list, optional): repository content types to combined with the
                                 primary content type.
             excludeIds (list or dict): exclude any locators for idCodes in this list or dictionary
+            sortResults (bool, optional): sort simple data file path lists. Defaults to True.
 
         Returns:
             (list): simple list of data file paths OR a tuple containing file path, format and merge details
@@ -141,34 +393,75 @@ class RepositoryProvider(object):
         inputPathList = inputPathList if inputPathList else []
         inputIdCodeList = inputIdCodeList if inputIdCodeList else []
         if inputPathList:
-            return self.__getLocatorObjListWithInput(contentType, inputPathList=inputPathList, mergeContentTypes=mergeContentTypes)
+            return self.__getLocatorObjListWithInput(contentType, inputPathList=inputPathList, mergeContentTypes=mergeContentTypes, sortResults=sortResults)
         #
-        locatorList = self.__getLocatorList(contentType, inputPathList=inputPathList, inputIdCodeList=inputIdCodeList, mergeContentTypes=mergeContentTypes)
+        locatorList = self.__getLocatorList(contentType, inputPathList=inputPathList, inputIdCodeList=inputIdCodeList, mergeContentTypes=mergeContentTypes, sortResults=sortResults)
         #
-        if excludeIds:
-            fL = []
-            for locator in locatorList:
-                if isinstance(locator, str):
-                    pth = locator
-                else:
-                    pth = locator[0]["locator"]
-                #
-                idCode = self.__getIdcodeFromLocatorPath(contentType, pth)
-                if idCode in excludeIds:
-                    continue
-                fL.append(locator)
-            locatorList = fL
+        if excludeIds and locatorList:
+            excludeIdS = excludeIds if isinstance(excludeIds, (collections.abc.Set, collections.abc.Mapping)) else frozenset(excludeIds)
+            if isinstance(locatorList[0], str):
+                locatorList = [locator for locator in locatorList if self.__getIdcodeFromLocatorPath(contentType, locator) not in excludeIdS]
+            else:
+                locatorList = [locator for locator in locatorList if self.__getIdcodeFromLocatorPath(contentType, locator[0]["locator"]) not in excludeIdS]
 
         return locatorList
 
     def getContainerList(self, locatorObjList):
-        """Return the PDBx data container list obtained by parsing the input locator object list."""
-        cL = []
-        for locatorObj in locatorObjList:
-            myContainerList = self.__mergeContainers(locatorObj, fmt="mmcif", mergeTarget=0)
-            for cA in myContainerList:
-                cL.append(cA)
-        return cL
+        """Return the PDBx data container list obtained by parsing the input locator object list. Longer lists
+        are read and merged in parallel (numProc processes). Containers are returned in the input order.
+        """
+        # Worker results are (input index, container list) pairs, so the input order can be restored
+        rL = self.__runReadWorker("_mergeContainersWorker", list(enumerate(locatorObjList)))
+        return [container for _, cL in sorted(rL, key=operator.itemgetter(0)) for container in cL]
+
+    def __runReadWorker(self, workerMethod, dataList, optionsD=None):
+        """Run the input worker method over the input list, using numProc worker processes for longer lists
+        (in which case the result order may differ from the input order) and in this process otherwise.
+        Items failing in the parallel run (or the input list, if the parallel run cannot be made) are
+        processed in this process.
+
+        Args:
+            workerMethod (str): name of the worker method f(dataList, procName, optionsD, workingDir) -> (dataList, resultList, diagList)
+            dataList (list): worker input list
+            optionsD (dict, optional): worker options. Defaults to None.
+
+        Returns:
+            (list): concatenated worker results
+        """
+        optionsD = optionsD if optionsD else {}
+        # Daemonic (e.g., pool worker) processes cannot start child processes
+        if self.__numProc > 1 and len(dataList) >= _MIN_PARALLEL_READ_COUNT and not multiprocessing.current_process().daemon:
+            try:
+                mpu = MultiProcUtil(verbose=self.__verbose)
+                mpu.setOptions(optionsD=optionsD)
+                mpu.set(workerObj=self, workerMethod=workerMethod)
+                ok, failList, retLists, _ = mpu.runMulti(dataList=dataList, numProc=self.__numProc, numResults=1)
+                if ok:
+                    return retLists[0]
+                logger.warning("Parallel %s failing for %d of %d items - reprocessing these serially", workerMethod, len(failList), len(dataList))
+                _, rL, _ = getattr(self, workerMethod)(failList, "main", optionsD, None)
+                return retLists[0] + rL
+            except Exception as e:
+                logger.exception("Failing parallel %s for %d items with %s", workerMethod, len(dataList), str(e))
+        _, rL, _ = getattr(self, workerMethod)(dataList, "main", optionsD, None)
+        return rL
+
+    def _mergeContainersWorker(self, dataList, procName, optionsD, workingDir):
+        """Return (input index, [container, ...]) pairs obtained by parsing and merging the input (input index, locator object) pairs."""
+        _ = procName
+        _ = optionsD
+        _ = workingDir
+        rL = []
+        # A single thread pool serves the concurrent reads of all multi-file locator objects in this worker
+        maxFiles = max((len(locatorObj) for _, locatorObj in dataList if isinstance(locatorObj, (list, tuple))), default=0)
+        if maxFiles > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(maxFiles, 4)) as executor:
+                for ii, locatorObj in dataList:
+                    rL.append((ii, self.__mergeContainers(locatorObj, fmt="mmcif", mergeTarget=0, executor=executor)))
+        else:
+            for ii, locatorObj in dataList:
+                rL.append((ii, self.__mergeContainers(locatorObj, fmt="mmcif", mergeTarget=0)))
+        return dataList, rL, []
 
     def getLocatorIdcodes(self, contentType, locatorObjList, locatorIndex=0):
         try:
@@ -198,22 +491,15 @@ class RepositoryProvider(object):
             if locatorObjList and isinstance(locatorObjList[0], str):
                 return pathList
             #
-            locIdx = {}
-            for ii, locatorObj in enumerate(locatorObjList):
-                if "locator" in locatorObj[locatorIndex]:
-                    locIdx[locatorObj[locatorIndex]["locator"]] = ii
-            #
-            for pth in pathList:
-                jj = locIdx[pth] if pth in locIdx else None
-                if jj is not None:
-                    rL.append(locatorObjList[jj])
+            locIdx = {locatorObj[locatorIndex]["locator"]: locatorObj for locatorObj in locatorObjList if "locator" in locatorObj[locatorIndex]}
+            rL = [locIdx[pth] for pth in pathList if pth in locIdx]
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         #
         return rL
 
     #  ---- Private methods ----
-    def __getLocatorObjListWithInput(self, contentType, inputPathList=None, mergeContentTypes=None):
+    def __getLocatorObjListWithInput(self, contentType, inputPathList=None, mergeContentTypes=None, sortResults=True):
         """Convenience method to get the data path list for the input repository content type.
         This is a special case to handle the content merging for the input path/locator list.
 
@@ -222,36 +508,45 @@ class RepositoryProvider(object):
             inputPathList (list, optional): path list that will be returned if provided.
             mergeContentTypes (list, optional): repository content types to combined with the
                                 primary content type.
+            sortResults (bool, optional): sort simple data file path lists. Defaults to True.
 
         Returns:
             Obj list: data file paths or tuple of file paths
 
         """
         inputPathList = inputPathList if inputPathList else []
-        locatorList = self.__getLocatorList(contentType, inputPathList=inputPathList)
+        locatorList = self.__getLocatorList(contentType, inputPathList=inputPathList, sortResults=sortResults)
 
         if mergeContentTypes and "vrpt" in mergeContentTypes and contentType in ["pdbx", "pdbx_core"]:
             dictPath = os.path.join(self.__topCachePath, self.__cfgOb.get("DICTIONARY_CACHE_DIR", sectionName=self.__cfgOb.getDefaultSectionName()))
             os.environ["_RP_DICT_PATH_"] = dictPath
             #
-            locObjL = []
+            # Candidate merge locators are collected first so that their existence is tested in a single batch
+            getLocator = self.__getLocator
+            mergeLocatorD = {}
             for locator in locatorList:
                 if isinstance(locator, str):
-                    kwD = HashableDict({})
-                    oL = [HashableDict({"locator": locator, "fmt": "mmcif", "kwargs": kwD})]
-                    for mergeContentType in mergeContentTypes:
-                        _, fn = os.path.split(locator)
-                        idCode = fn[:4] if fn and len(fn) >= 8 else None
-                        mergeLocator = self.__getLocator(mergeContentType, idCode, checkExists=True) if idCode else None
-                        if mergeLocator:
-                            # kwD = HashableDict({"marshalHelper": vrd.toCif})
-                            kwD = HashableDict({"marshalHelper": toCifWrapper})
-                            oL.append(HashableDict({"locator": mergeLocator, "fmt": "xml", "kwargs": kwD}))
-                    lObj = tuple(oL)
-                else:
+                    fn = locator.rpartition(os.sep)[2]
+                    idCode = fn[:4] if len(fn) >= 8 else None
+                    if idCode:
+                        for mergeContentType in mergeContentTypes:
+                            mergeLocatorD[(locator, mergeContentType)] = getLocator(mergeContentType, idCode)
+            if self.__discoveryMode == "local":
+                existsD = self.__batchExists(mergeLocatorD.values())
+                mergeLocatorD = {ky: mergeLocator if existsD.get(mergeLocator) else None for ky, mergeLocator in mergeLocatorD.items()}
+            #
+            getMergeLocator = mergeLocatorD.get
+            locObjL = []
+            for locator in locatorList:
+                if not isinstance(locator, str):
                     logger.error("Unexpected output locator type %r", locator)
-                    lObj = locator
-                locObjL.append(lObj)
+                    locObjL.append(locator)
+                    continue
+                mergeLocatorL = [getMergeLocator((locator, mergeContentType)) for mergeContentType in mergeContentTypes]
+                locObjL.append(
+                    (HashableDict({"locator": locator, "fmt": "mmcif", "kwargs": _EMPTY_KW}),)
+                    + tuple(HashableDict({"locator": mergeLocator, "fmt": "xml", "kwargs": _VRPT_KW}) for mergeLocator in mergeLocatorL if mergeLocator)
+                )
             #
             locatorList = locObjL
         # -
@@ -266,8 +561,25 @@ class RepositoryProvider(object):
         # -
         return locatorList
 
-    def __mergeContainers(self, locatorObj, fmt="mmcif", mergeTarget=0):
-        """Consolidate content in auxiliary files locatorObj[1:] into the locatorObj[0] container index 'mergeTarget'."""
+    def __batchExists(self, pathList):
+        """Test the existence of the input paths. The blocking stat() calls are issued concurrently.
+
+        Args:
+            pathList (iterable): file paths (None values are reported as missing)
+
+        Returns:
+            (dict): {path: True if the path exists or False otherwise, ...}
+        """
+        pathList = list(dict.fromkeys(pth for pth in pathList if pth))
+        if not pathList:
+            return {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(self.__numProc, len(pathList)))) as executor:
+            return dict(zip(pathList, executor.map(self.__mU.exists, pathList)))
+
+    def __mergeContainers(self, locatorObj, fmt="mmcif", mergeTarget=0, executor=None):
+        """Consolidate content in auxiliary files locatorObj[1:] into the locatorObj[0] container index 'mergeTarget'.
+        The files in a multi-file locator object are read concurrently when an executor is provided.
+        """
         #
         cL = []
         try:
@@ -283,22 +595,32 @@ class RepositoryProvider(object):
             #
             elif isinstance(locatorObj, (list, tuple)) and locatorObj:
                 # This is followed for Experimental mmCIF files (anything with have an associated validation report file)
-                dD = locatorObj[0]
-                kw = dD["kwargs"]
-                cL = self.__mU.doImport(dD["locator"], fmt=dD["fmt"], **kw)
-                if cL:
-                    for dD in locatorObj[1:]:
-                        kw = dD["kwargs"]
-                        rObj = self.__mU.doImport(dD["locator"], fmt=dD["fmt"], **kw)
-                        mergeL = rObj if rObj else []
-                        if not mergeL:
-                            logger.error("locator object with leading path %r returned empty container list (%r)", dD["locator"], locatorObj)
-                            raise ValueError("locator object with leading path %r returned empty container list (%r)" % (dD["locator"], locatorObj))
-                        for mc in mergeL:
-                            cL[mergeTarget].merge(mc)
+                # The primary and auxiliary files are independent reads, so these are submitted together to the executor
+                if executor and len(locatorObj) > 1:
+                    futureL = [executor.submit(self.__mU.doImport, dD["locator"], fmt=dD["fmt"], **dD["kwargs"]) for dD in locatorObj]
+                    readL = [future.result for future in futureL]
                 else:
-                    logger.error("locator object with leading path %r returned empty container list (%r)", dD["locator"], locatorObj)
-                    raise ValueError("locator object with leading path %r returned empty container list (%r)" % (dD["locator"], locatorObj))
+                    futureL = []
+                    readL = [functools.partial(self.__mU.doImport, dD["locator"], fmt=dD["fmt"], **dD["kwargs"]) for dD in locatorObj]
+                try:
+                    dD = locatorObj[0]
+                    cL = readL[0]()
+                    if cL:
+                        for dD, read in zip(locatorObj[1:], readL[1:]):
+                            rObj = read()
+                            mergeL = rObj if rObj else []
+                            if not mergeL:
+                                logger.error("locator object with leading path %r returned empty container list (%r)", dD["locator"], locatorObj)
+                                raise ValueError("locator object with leading path %r returned empty container list (%r)" % (dD["locator"], locatorObj))
+                            for mc in mergeL:
+                                cL[mergeTarget].merge(mc)
+                    else:
+                        logger.error("locator object with leading path %r returned empty container list (%r)", dD["locator"], locatorObj)
+                        raise ValueError("locator object with leading path %r returned empty container list (%r)" % (dD["locator"], locatorObj))
+                except Exception:
+                    for future in futureL:
+                        future.cancel()
+                    raise
             #
             else:
                 logger.warning("non-comforming locator object %r", locatorObj)
@@ -309,43 +631,47 @@ class RepositoryProvider(object):
         #
         return cL if cL else []
 
-    def __getLocatorList(self, contentType, inputPathList=None, inputIdCodeList=None, mergeContentTypes=None):
+    def __getLocatorList(self, contentType, inputPathList=None, inputIdCodeList=None, mergeContentTypes=None, sortResults=False):
+        # Sorting is left to callers requiring ordered path lists (internal index builders do not)
         if self.__discoveryMode == "local":
-            return self.__getLocatorListLocal(contentType, inputPathList=inputPathList, mergeContentTypes=mergeContentTypes)
+            locatorList = self.__getLocatorListLocal(contentType, inputPathList=inputPathList, inputIdCodeList=inputIdCodeList, mergeContentTypes=mergeContentTypes)
         else:
-            return self.__getLocatorListRemote(contentType, inputIdCodeList=inputIdCodeList, mergeContentTypes=mergeContentTypes)
+            locatorList = self.__getLocatorListRemote(contentType, inputIdCodeList=inputIdCodeList, mergeContentTypes=mergeContentTypes)
+        return sorted(locatorList) if sortResults and locatorList and isinstance(locatorList[0], str) else locatorList
 
-    def __getLocatorListLocal(self, contentType, inputPathList=None, mergeContentTypes=None):
+    def __getLocatorListLocal(self, contentType, inputPathList=None, inputIdCodeList=None, mergeContentTypes=None):
         """Internal convenience method to return repository local path lists by content type:"""
         outputLocatorList = []
-        inputPathList = inputPathList if inputPathList else []
         try:
-            if contentType in ["bird", "bird_core"]:
-                outputLocatorList = inputPathList if inputPathList else self.__getBirdPathList()
-            elif contentType == "bird_family":
-                outputLocatorList = inputPathList if inputPathList else self.__getBirdFamilyPathList()
-            elif contentType in ["chem_comp"]:
-                outputLocatorList = inputPathList if inputPathList else self.__getChemCompPathList()
-            elif contentType in ["bird_chem_comp"]:
-                outputLocatorList = inputPathList if inputPathList else self.__getBirdChemCompPathList()
+            if inputIdCodeList and not inputPathList and contentType in _LOCAL_ID_CODE_CONTENT_TYPES and not (mergeContentTypes and "vrpt" in mergeContentTypes):
+                outputLocatorList = self.__getLocalPathListFromIdCodes(_LOCAL_ID_CODE_CONTENT_TYPES[contentType], inputIdCodeList)
             elif contentType in ["pdbx", "pdbx_core"] and mergeContentTypes and "vrpt" in mergeContentTypes:
                 dictPath = os.path.join(self.__topCachePath, self.__cfgOb.get("DICTIONARY_CACHE_DIR", sectionName=self.__cfgOb.getDefaultSectionName()))
                 os.environ["_RP_DICT_PATH_"] = dictPath
                 outputLocatorList = self.__getEntryLocatorObjList(mergeContentTypes=mergeContentTypes)
-
+            elif inputPathList and contentType in _LOCAL_CONTENT_TYPES:
+                outputLocatorList = inputPathList
+            elif contentType in ["bird", "bird_core"]:
+                outputLocatorList = self.__getBirdPathList()
+            elif contentType == "bird_family":
+                outputLocatorList = self.__getBirdFamilyPathList()
+            elif contentType in ["chem_comp"]:
+                outputLocatorList = self.__getChemCompPathList()
+            elif contentType in ["bird_chem_comp"]:
+                outputLocatorList = self.__getBirdChemCompPathList()
             elif contentType in ["pdbx", "pdbx_core"]:
-                outputLocatorList = inputPathList if inputPathList else self.__getEntryPathList()
+                outputLocatorList = self.__getEntryPathList()
             #
             elif contentType in ["pdbx_obsolete"]:
-                outputLocatorList = inputPathList if inputPathList else self.getObsoleteEntryPathList()
+                outputLocatorList = self.getObsoleteEntryPathList()
             elif contentType in ["chem_comp_core", "bird_consolidated", "bird_chem_comp_core"]:
-                outputLocatorList = inputPathList if inputPathList else self.mergeBirdAndChemCompRefData()
+                outputLocatorList = self.mergeBirdAndChemCompRefData()
             elif contentType in ["ihm_dev", "ihm_dev_core", "ihm_dev_full"]:
-                outputLocatorList = inputPathList if inputPathList else self.__getIhmDevPathList()
+                outputLocatorList = self.__getIhmDevPathList()
             elif contentType in ["pdb_distro", "da_internal", "status_history"]:
-                outputLocatorList = inputPathList if inputPathList else []
+                outputLocatorList = []
             elif contentType in ["pdbx_comp_model_core"]:
-                outputLocatorList = inputPathList if inputPathList else self.__getCompModelPathList()
+                outputLocatorList = self.__getCompModelPathList()
             else:
                 logger.warning("Unsupported contentType %s", contentType)
         except Exception as e:
@@ -354,7 +680,25 @@ class RepositoryProvider(object):
         if self.__fileLimit:
             outputLocatorList = outputLocatorList[: self.__fileLimit]
 
-        return sorted(outputLocatorList) if outputLocatorList and isinstance(outputLocatorList[0], str) else outputLocatorList
+        return outputLocatorList
+
+    def __getLocalPathListFromIdCodes(self, contentType, idCodeList):
+        """Return the existing local repository paths for the input identifiers. Paths are tested directly
+        (in a single batch) rather than discovered by scanning the repository.
+
+        Args:
+            contentType (str): repository content type
+            idCodeList (list): identifiers
+
+        Returns:
+            (list): existing repository paths
+        """
+        idCodeList = list(dict.fromkeys(idCode.upper() for idCode in idCodeList))
+        pathList = [self.__getLocatorLocal(contentType, idCode) for idCode in idCodeList]
+        existsD = self.__batchExists(pathList)
+        pathList = [pth for pth in pathList if existsD.get(pth)]
+        logger.info("Found %d of %d %s paths for input identifiers", len(pathList), len(idCodeList), contentType)
+        return pathList
 
     def __getLocatorListRemote(self, contentType, inputIdCodeList=None, mergeContentTypes=None):
         outputLocatorList = []
@@ -401,7 +745,7 @@ class RepositoryProvider(object):
             outputLocatorList = outputLocatorList[: self.__fileLimit]
             logger.debug("outputLocatorList after applying fileLimit (%r): %r", self.__fileLimit, outputLocatorList)
 
-        return sorted(outputLocatorList) if outputLocatorList and isinstance(outputLocatorList[0], str) else outputLocatorList
+        return outputLocatorList
 
     def __getLocator(self, contentType, idCode, version="v1-0", checkExists=False):
         if self.__discoveryMode == "local":
@@ -413,25 +757,9 @@ class RepositoryProvider(object):
         """Convenience method to return repository path for a content type and cardinal identifier."""
         pth = None
         try:
-            idCodel = idCode.lower()
-            if contentType == "bird":
-                pth = os.path.join(self.__getRepoLocalPath(contentType), idCode[-1], idCode + ".cif")
-            elif contentType == "bird_family":
-                pth = os.path.join(self.__getRepoLocalPath(contentType), idCode[-1], idCode + ".cif")
-            elif contentType in ["chem_comp", "chem_comp_core"]:
-                pth = os.path.join(self.__getRepoLocalPath(contentType), idCode[0], idCode, idCode + ".cif")
-            elif contentType in ["bird_chem_comp"]:
-                pth = os.path.join(self.__getRepoLocalPath(contentType), idCode[-1], idCode + ".cif")
-            elif contentType in ["pdbx", "pdbx_core", "pdbx_obsolete"]:
-                pth = os.path.join(self.__getRepoLocalPath(contentType), idCodel[1:3], idCodel + ".cif.gz")
-            elif contentType in ["bird_consolidated", "bird_chem_comp_core"]:
-                pth = os.path.join(self.__getRepoLocalPath(contentType), idCode + ".cif")
-            elif contentType in ["ihm_dev", "ihm_dev_core", "ihm_dev_full"]:
-                pth = os.path.join(self.__getRepoLocalPath(contentType), idCode, idCode + "_model_%s.cif.gz" % version)
-            elif contentType in ["pdb_distro", "da_internal", "status_history"]:
-                pass
-            elif contentType in ["vrpt"]:
-                pth = os.path.join(self.__getRepoLocalPath(contentType), idCodel[1:3], idCodel, idCodel + "_validation.xml.gz")
+            if contentType in _LOCAL_LOCATOR_TEMPLATES:
+                templateFunc = _LOCAL_LOCATOR_TEMPLATES[contentType]
+                pth = self.__getRepoLocalPrefix(contentType) + templateFunc(idCode, version) if templateFunc else None
             else:
                 logger.warning("Unsupported local contentType %s", contentType)
         except Exception as e:
@@ -447,35 +775,28 @@ class RepositoryProvider(object):
         _ = repositoryLayout
         try:
             idCodel = idCode.lower()
-            if contentType == "bird":
-                # /pdb/refdata/bird/prd/1/
-                uri = os.path.join(self.__baseUrlPDB, "pdb", "refdata", "bird", "prd", idCode[-1], idCode + ".cif")
-            elif contentType == "bird_family":
-                uri = os.path.join(self.__baseUrlPDB, "pdb", "refdata", "bird", "family", idCode[-1], idCode + ".cif")
-            elif contentType in ["bird_chem_comp"]:
-                uri = os.path.join(self.__baseUrlPDB, "pdb", "refdata", "bird", "prdcc", idCode[-1], idCode + ".cif")
-            elif contentType in ["chem_comp", "chem_comp_core"]:
-                uri = os.path.join(self.__baseUrlPDB, "pdb", "refdata", "chem_comp", idCode[-1], idCode, idCode + ".cif")
-            #
-            elif contentType in ["pdbx", "pdbx_core"]:
+            if contentType in ["pdbx", "pdbx_core"]:
                 # pdb/data/structures/divided/mmCIF
-                uri = os.path.join(self.__baseUrlPDB, "pdb", "data", "structures", "divided", "mmCIF", idCodel[1:3], idCodel + ".cif.gz")
+                uri = f"{self.__remotePrefixD['pdbx']}{idCodel[1:3]}/{idCodel}.cif.gz"
             elif contentType in ["vrpt", "validation_report"]:
                 # /pdb/validation_reports/
                 # https://files.wwpdb.org/pub/pdb/validation_reports/00/100d/100d_validation.xml.gz
-                uri = os.path.join(self.__baseUrlPDB, "pdb", "validation_reports", idCodel[1:3], idCodel, idCodel + "_validation.xml.gz")
-                # logger.info("uri %r", uri)
-            #
+                uri = f"{self.__remotePrefixD['vrpt']}{idCodel[1:3]}/{idCodel}/{idCodel}_validation.xml.gz"
             elif contentType in ["pdbx_obsolete"]:
                 # pdb/data/structures/obsolete/mmCIF/
-                uri = os.path.join(self.__baseUrlPDB, "pdb", "data", "structures", "obsolete", "mmCIF", idCodel[1:3], idCodel + ".cif.gz")
+                uri = f"{self.__remotePrefixD['pdbx_obsolete']}{idCodel[1:3]}/{idCodel}.cif.gz"
+            #
+            elif contentType in ["bird", "bird_family", "bird_chem_comp"]:
+                # /pdb/refdata/bird/prd/1/
+                uri = f"{self.__remotePrefixD[contentType]}{idCode[-1]}/{idCode}.cif"
+            elif contentType in ["chem_comp", "chem_comp_core"]:
+                uri = f"{self.__remotePrefixD['chem_comp']}{idCode[-1]}/{idCode}/{idCode}.cif"
             elif contentType in ["bird_consolidated", "bird_chem_comp_core"]:
-                uri = os.path.join(self.__getRepoLocalPath(contentType), idCode + ".cif")
+                uri = f"{self.__getRepoLocalPrefix(contentType)}{idCode}.cif"
             #
             elif contentType in ["ihm_dev", "ihm_dev_core", "ihm_dev_full"]:
-
                 # https://pdb-dev.wwpdb.org/cif/PDBDEV_00000001.cif
-                uri = os.path.join(self.__baseUrlPDBDev, "cif", idCode + ".cif")
+                uri = f"{self.__remotePrefixD['ihm_dev']}{idCode}.cif"
             elif contentType in ["pdb_distro", "da_internal", "status_history"]:
                 pass
             else:
@@ -485,21 +806,37 @@ class RepositoryProvider(object):
 
         return uri
 
+    def __getRepoLocalPrefix(self, contentType):
+        """Return the repository top path (with trailing separator) for the input content type. Prefixes for
+        paths assigned in the static configuration are cached by content type.
+
+        Args:
+            contentType (str): repository content type
+
+        Raises:
+            ValueError: if no repository path is configured for the content type
+
+        Returns:
+            (str): repository top path prefix
+        """
+        prefix = self.__localPrefixD.get(contentType)
+        if prefix is None:
+            pth = self.__getRepoLocalPath(contentType)
+            if pth is None:
+                raise ValueError("No repository path for content type %r" % contentType)
+            prefix = os.path.join(pth, "")
+            # Prefixes follow the caching of the repository paths
+            if contentType in self.__repoLocalPathD:
+                self.__localPrefixD[contentType] = prefix
+        return prefix
+
     def __getIdcodeFromLocatorPath(self, contentType, pth):
         """Convenience method to return the idcode from the locator path."""
         idCode = None
         try:
-            bn = os.path.basename(pth)
-            if contentType in ["pdbx", "pdbx_core", "pdbx_obsolete", "bird", "bird_family", "chem_comp", "chem_comp_core", "bird_consolidated", "bird_chem_comp_core"]:
-                idCode = bn.split(".")[0]
-            elif contentType in ["ihm_dev", "ihm_dev_core", "ihm_dev_full"]:
-                tC = bn.split(".")[0]
-                idCode = "_".join(tC.split("_")[:2])
-            elif contentType in ["pdb_distro", "da_internal", "status_history"]:
-                idCode = None
-            elif contentType in ["vrpt"]:
-                tC = bn.split(".")[0]
-                idCode = tC.split("_")[0]
+            if contentType in _ID_CODE_FILE_NAME_PARSERS:
+                parseFunc = _ID_CODE_FILE_NAME_PARSERS[contentType]
+                idCode = parseFunc(pth.rpartition(os.sep)[2]) if parseFunc else None
             else:
                 logger.warning("Unsupported contentType %s", contentType)
             idCode = idCode.upper() if idCode else None
@@ -508,37 +845,30 @@ class RepositoryProvider(object):
         return idCode
 
     def __getRepoLocalPath(self, contentType):
-        """Convenience method to return repository top path from configuration data."""
-        pth = None
+        """Convenience method to return repository top path from configuration data. Paths assigned in the
+        static configuration are cached by content type, while the validation report path (which may be
+        assigned in the environment) is looked up on each call.
+        """
+        pth = self.__repoLocalPathD.get(contentType)
+        if pth is not None:
+            return pth
         try:
-            if contentType == "bird":
-                pth = self.__cfgOb.getPath("BIRD_REPO_PATH", sectionName=self.__configName)
-            elif contentType == "bird_family":
-                pth = self.__cfgOb.getPath("BIRD_FAMILY_REPO_PATH", sectionName=self.__configName)
-            elif contentType in ["chem_comp", "chem_comp_core"]:
-                pth = self.__cfgOb.getPath("CHEM_COMP_REPO_PATH", sectionName=self.__configName)
-            elif contentType in ["bird_chem_comp"]:
-                pth = self.__cfgOb.getPath("BIRD_CHEM_COMP_REPO_PATH", sectionName=self.__configName)
-            elif contentType in ["pdbx", "pdbx_core"]:
-                pth = self.__cfgOb.getPath("PDBX_REPO_PATH", sectionName=self.__configName)
-            elif contentType in ["pdbx_obsolete"]:
-                pth = self.__cfgOb.getPath("PDBX_OBSOLETE_REPO_PATH", sectionName=self.__configName)
-            elif contentType in ["pdbx_comp_model_core"]:
-                pth = self.__cfgOb.getPath("PDBX_COMP_MODEL_REPO_PATH", sectionName=self.__configName)
-            elif contentType in ["bird_consolidated", "bird_chem_comp_core"]:
+            if contentType in ["bird_consolidated", "bird_chem_comp_core"]:
                 pth = self.__cachePath
-            elif contentType in ["ihm_dev", "ihm_dev_core", "ihm_dev_full"]:
-                pth = self.__cfgOb.getPath("IHM_DEV_REPO_PATH", sectionName=self.__configName)
-            elif contentType in ["pdb_distro", "da_internal", "status_history"]:
-                pass
             elif contentType in ["vrpt"]:
                 pth = self.__cfgOb.getEnvValue("VRPT_REPO_PATH_ENV", sectionName=self.__configName, default=None)
                 if pth is None:
                     pth = self.__cfgOb.getPath("VRPT_REPO_PATH", sectionName=self.__configName)
                 else:
                     logger.debug("Using validation report path from environment assignment %s", pth)
+                return pth
+            elif contentType in _REPO_PATH_CONFIG_KEYS:
+                configKey = _REPO_PATH_CONFIG_KEYS[contentType]
+                pth = self.__cfgOb.getPath(configKey, sectionName=self.__configName) if configKey else None
             else:
                 logger.warning("Unsupported contentType %s", contentType)
+            if pth is not None:
+                self.__repoLocalPathD[contentType] = pth
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         return pth
@@ -557,10 +887,7 @@ class RepositoryProvider(object):
             tIdL = self.__chP.getEntryIdList()
             logger.info("original tIdL length (%r)", len(tIdL))
             if idCodeList:
-                tIdD = dict.fromkeys(tIdL, True)
-                tIdL = [idCode.upper() for idCode in idCodeList if idCode.upper() in tIdD]
-                # idCodeList = [t.upper() for t in idCodeList]
-                # tIdL = list(set(tIdL).intersection(idCodeList))
+                tIdL = self.__selectIdCodes(idCodeList, "entry", tIdL)
                 logger.debug("idCodeList selected tIdL: %r", tIdL)
                 logger.info("idCodeList selected tIdL length (%r)", len(tIdL))
                 if len(tIdL) > 10:
@@ -569,14 +896,14 @@ class RepositoryProvider(object):
             if not (mergeContentTypes and "vrpt" in mergeContentTypes):
                 logger.error("Validation mergeContentTypes not enabled!")
             #
+            mergeVrpt = bool(mergeContentTypes and "vrpt" in mergeContentTypes)
+            getLocator = self.__getLocatorRemote
             for tId in tIdL:
-                kwD = HashableDict({})
-                locObj = [HashableDict({"locator": self.__getLocatorRemote("pdbx_core", tId), "fmt": "mmcif", "kwargs": kwD})]
-                if mergeContentTypes and "vrpt" in mergeContentTypes:
+                locObj = [HashableDict({"locator": getLocator("pdbx_core", tId), "fmt": "mmcif", "kwargs": _EMPTY_KW})]
+                if mergeVrpt:
                     # if self.__chP.hasEntryContentType(tId, "validation_report"):
                     if self.__chP.hasValidationReportData(tId):
-                        kwD = HashableDict({"marshalHelper": toCifWrapper})
-                        locObj.append(HashableDict({"locator": self.__getLocatorRemote("validation_report", tId), "fmt": "xml", "kwargs": kwD}))
+                        locObj.append(HashableDict({"locator": getLocator("validation_report", tId), "fmt": "xml", "kwargs": _VRPT_KW}))
                     else:
                         logger.warning("Validation data not found for id %r", tId)
                 uL.append(tuple(locObj))
@@ -592,33 +919,70 @@ class RepositoryProvider(object):
             #
             tIdL = self.__rhP.getEntryByStatus("OBS")
             if idCodeList:
-                tIdD = dict.fromkeys(tIdL, True)
-                tIdL = [idCode.upper() for idCode in idCodeList if idCode.upper() in tIdD]
+                tIdL = self.__selectIdCodes(idCodeList, "obsolete", tIdL)
                 logger.info("idCodeList selected: %r", tIdL)
             #
-            for tId in tIdL:
-                kwD = HashableDict({})
-                locObj = [HashableDict({"locator": self.__getLocatorRemote("pdbx_obsolete", tId), "fmt": "mmcif", "kwargs": kwD})]
-                uL.append(tuple(locObj))
+            getLocator = self.__getLocatorRemote
+            uL = [(HashableDict({"locator": getLocator("pdbx_obsolete", tId), "fmt": "mmcif", "kwargs": _EMPTY_KW}),) for tId in tIdL]
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         return self.__applyLimit(uL)
 
+    def __selectIdCodes(self, idCodeList, idListName, tIdL):
+        """Return the input identifiers (upper case, in input order) present in the holdings identifier list.
+
+        Args:
+            idCodeList (list): input identifiers
+            idListName (str): name of the holdings identifier list (e.g., entry, obsolete, bird, ...)
+            tIdL (list): holdings identifier list (converted to a set once per list name)
+
+        Returns:
+            (list): selected identifiers
+        """
+        idCodeS = self.__idCodeSetD.get(idListName)
+        if idCodeS is None:
+            idCodeS = self.__idCodeSetD[idListName] = frozenset(tIdL)
+        return [idCodeU for idCodeU in (idCode.upper() for idCode in idCodeList) if idCodeU in idCodeS]
+
+    def __getRemoteRefIdList(self, contentType, idCodeList=None):
+        """Return the holdings identifiers for the input reference data content type (bird, bird_family,
+        chem_comp or bird_chem_comp), optionally restricted to the input identifier list.
+        """
+        if not self.__chP:
+            self.__chP = CurrentHoldingsProvider(self.__topCachePath, **self.__kwD)
+        #
+        getIdListD = {
+            "bird": self.__chP.getBirdIdList,
+            "bird_family": self.__chP.getBirdFamilyIdList,
+            "chem_comp": self.__chP.getChemCompIdList,
+            "bird_chem_comp": self.__chP.getBirdChemCompIdList,
+        }
+        tIdL = getIdListD[contentType]()
+        if idCodeList:
+            tIdL = self.__selectIdCodes(idCodeList, contentType, tIdL)
+            logger.info("idCodeList selected: %r", tIdL)
+        return tIdL
+
+    def __getRefDataPathList(self, contentType, idCodeList=None):
+        """Return the file paths (or URLs in remote discovery mode) for the input reference data content type
+        (bird, bird_family, chem_comp or bird_chem_comp) without building locator objects.
+        """
+        if self.__discoveryMode == "local":
+            return self.getLocatorPaths(self.__getLocatorList(contentType, inputIdCodeList=idCodeList))
+        pathList = []
+        try:
+            getLocator = self.__getLocatorRemote
+            pathList = [getLocator(contentType, tId) for tId in self.__getRemoteRefIdList(contentType, idCodeList=idCodeList)]
+        except Exception as e:
+            logger.exception("Failing for %r with %s", contentType, str(e))
+        return self.__applyLimit(pathList)
+
     def __getBirdUriList(self, idCodeList=None):
         uL = []
         try:
-            if not self.__chP:
-                self.__chP = CurrentHoldingsProvider(self.__topCachePath, **self.__kwD)
-            #
-            tIdL = self.__chP.getBirdIdList()
-            if idCodeList:
-                tIdD = dict.fromkeys(tIdL, True)
-                tIdL = [idCode.upper() for idCode in idCodeList if idCode.upper() in tIdD]
-                logger.info("idCodeList selected: %r", tIdL)
-            #
-            kwD = HashableDict({})
-            for tId in tIdL:
-                uL.append(tuple([HashableDict({"locator": self.__getLocatorRemote("bird", tId), "fmt": "mmcif", "kwargs": kwD})]))
+            tIdL = self.__getRemoteRefIdList("bird", idCodeList=idCodeList)
+            getLocator = self.__getLocatorRemote
+            uL = [(HashableDict({"locator": getLocator("bird", tId), "fmt": "mmcif", "kwargs": _EMPTY_KW}),) for tId in tIdL]
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         return self.__applyLimit(uL)
@@ -626,18 +990,9 @@ class RepositoryProvider(object):
     def __getBirdFamilyUriList(self, idCodeList=None):
         uL = []
         try:
-            if not self.__chP:
-                self.__chP = CurrentHoldingsProvider(self.__topCachePath, **self.__kwD)
-            #
-            tIdL = self.__chP.getBirdFamilyIdList()
-            if idCodeList:
-                tIdD = dict.fromkeys(tIdL, True)
-                tIdL = [idCode.upper() for idCode in idCodeList if idCode.upper() in tIdD]
-                logger.info("idCodeList selected: %r", tIdL)
-            #
-            kwD = HashableDict({})
-            for tId in tIdL:
-                uL.append(tuple([{"locator": self.__getLocatorRemote("bird_family", tId), "fmt": "mmcif", "kwargs": kwD}]))
+            tIdL = self.__getRemoteRefIdList("bird_family", idCodeList=idCodeList)
+            getLocator = self.__getLocatorRemote
+            uL = [({"locator": getLocator("bird_family", tId), "fmt": "mmcif", "kwargs": _EMPTY_KW},) for tId in tIdL]
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         return self.__applyLimit(uL)
@@ -645,18 +1000,9 @@ class RepositoryProvider(object):
     def __getChemCompUriList(self, idCodeList=None):
         uL = []
         try:
-            if not self.__chP:
-                self.__chP = CurrentHoldingsProvider(self.__topCachePath, **self.__kwD)
-            #
-            tIdL = self.__chP.getChemCompIdList()
-            if idCodeList:
-                tIdD = dict.fromkeys(tIdL, True)
-                tIdL = [idCode.upper() for idCode in idCodeList if idCode.upper() in tIdD]
-                logger.info("idCodeList selected: %r", tIdL)
-            #
-            kwD = HashableDict({})
-            for tId in tIdL:
-                uL.append(tuple([HashableDict({"locator": self.__getLocatorRemote("chem_comp", tId), "fmt": "mmcif", "kwargs": kwD})]))
+            tIdL = self.__getRemoteRefIdList("chem_comp", idCodeList=idCodeList)
+            getLocator = self.__getLocatorRemote
+            uL = [(HashableDict({"locator": getLocator("chem_comp", tId), "fmt": "mmcif", "kwargs": _EMPTY_KW}),) for tId in tIdL]
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         return self.__applyLimit(uL)
@@ -664,18 +1010,9 @@ class RepositoryProvider(object):
     def __getBirdChemCompUriList(self, idCodeList=None):
         uL = []
         try:
-            if not self.__chP:
-                self.__chP = CurrentHoldingsProvider(self.__topCachePath, **self.__kwD)
-            #
-            tIdL = self.__chP.getBirdChemCompIdList()
-            if idCodeList:
-                tIdD = dict.fromkeys(tIdL, True)
-                tIdL = [idCode.upper() for idCode in idCodeList if idCode.upper() in tIdD]
-                logger.info("idCodeList selected: %r", tIdL)
-            #
-            kwD = HashableDict({})
-            for tId in tIdL:
-                uL.append(tuple([HashableDict({"locator": self.__getLocatorRemote("bird_chem_comp", tId), "fmt": "mmcif", "kwargs": kwD})]))
+            tIdL = self.__getRemoteRefIdList("bird_chem_comp", idCodeList=idCodeList)
+            getLocator = self.__getLocatorRemote
+            uL = [(HashableDict({"locator": getLocator("bird_chem_comp", tId), "fmt": "mmcif", "kwargs": _EMPTY_KW}),) for tId in tIdL]
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         return self.__applyLimit(uL)
@@ -689,16 +1026,63 @@ class RepositoryProvider(object):
         pathList = []
         for subdir in dataList:
             dd = os.path.join(topRepoPath, subdir)
-            for root, _, files in os.walk(dd, topdown=False):
-                if "REMOVE" in root:
-                    continue
-                for name in files:
-                    if name.endswith(".cif") and len(name) <= 7:
-                        pathList.append(os.path.join(root, name))
+            pathList.extend(_scanRepoPaths(dd, _isChemCompFileName))
         return dataList, pathList, []
 
+    def __runScanWorker(self, workerMethod, dataList, optionsD, numProc):
+        """Run the input repository scan worker over slices of the input (hash directory) list on a thread pool.
+        The scans are dominated by blocking directory reads, so threads avoid the cost of starting worker
+        processes (and of pickling this provider) for each scan. Each task takes a slice of several
+        directories to limit the per-task overhead.
+
+        Args:
+            workerMethod (method): scan worker f(dataList, procName, optionsD, workingDir) -> (dataList, resultList, diagList)
+            dataList (list): repository subdirectories to scan
+            optionsD (dict): worker options
+            numProc (int): number of worker threads
+
+        Returns:
+            (list): concatenated worker results
+        """
+        numProc = max(1, min(numProc, len(dataList)))
+        chunkSize = max(1, -(-len(dataList) // (numProc * 4)))
+        chunkL = [dataList[ii : ii + chunkSize] for ii in range(0, len(dataList), chunkSize)]
+        rL = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=numProc) as executor:
+            for _, retL, _ in executor.map(lambda chunk: workerMethod(chunk, "scanner", optionsD, None), chunkL):
+                rL.extend(retL)
+        return rL
+
+    def clearScanCache(self):
+        """Discard the retained results of local repository scans and the reference data indices built
+        from them (e.g., after repository content changes).
+        """
+        self.__scanCacheD = {}
+        self.__familyIndexCache = None
+        self.__birdCcIndexCacheD = {}
+
+    def __getScanPathList(self, fetchMethod, topRepoPath, **kwargs):
+        """Return the path list from the input repository scan method, scanning each repository top path once.
+        Content types sharing a repository (e.g., pdbx and pdbx_core or chem_comp and chem_comp_core) and
+        repeated requests (e.g., BIRD paths used for reference data consolidation) reuse the first scan.
+
+        Args:
+            fetchMethod (method): repository scan method f(topRepoPath, **kwargs) -> list
+            topRepoPath (str): repository top path
+
+        Returns:
+            (list): path list
+        """
+        ky = (fetchMethod.__name__, topRepoPath)
+        pathList = self.__scanCacheD.get(ky)
+        if pathList is None:
+            pathList = fetchMethod(topRepoPath, **kwargs)
+            if pathList:
+                self.__scanCacheD[ky] = pathList
+        return list(pathList)
+
     def __getChemCompPathList(self):
-        return self.__fetchChemCompPathList(self.__getRepoLocalPath("chem_comp"), numProc=self.__numProc)
+        return self.__getScanPathList(self.__fetchChemCompPathList, self.__getRepoLocalPath("chem_comp"), numProc=self.__numProc)
 
     def __fetchChemCompPathList(self, topRepoPath, numProc=8):
         """Get the path list for the chemical component definition repository"""
@@ -707,15 +1091,10 @@ class RepositoryProvider(object):
         startTime = time.time()
         pathList = []
         try:
-            dataS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
-            dataList = [a for a in dataS]
+            dataList = _listHashDirNames(topRepoPath, _CHEM_COMP_HASH_DIR_NAMES)
             optD = {}
             optD["topRepoPath"] = topRepoPath
-            mpu = MultiProcUtil(verbose=self.__verbose)
-            mpu.setOptions(optionsD=optD)
-            mpu.set(workerObj=self, workerMethod="_chemCompPathWorker")
-            _, _, retLists, _ = mpu.runMulti(dataList=dataList, numProc=numProc, numResults=1)
-            pathList = retLists[0]
+            pathList = self.__runScanWorker(self._chemCompPathWorker, dataList, optD, numProc)
             endTime0 = time.time()
             logger.debug("Path list length %d  in %.4f seconds", len(pathList), endTime0 - startTime)
         except Exception as e:
@@ -728,27 +1107,54 @@ class RepositoryProvider(object):
         _ = workingDir
         topRepoPath = optionsD["topRepoPath"]
         mergeContentTypes = optionsD["mergeContentTypes"]
+        isLocal = self.__discoveryMode == "local"
+        dirNameCacheD = {}
         locatorObjList = []
         for subdir in dataList:
             dd = os.path.join(topRepoPath, subdir)
-            for root, _, files in os.walk(dd, topdown=False):
-                if "REMOVE" in root:
-                    continue
-                for fn in files:
-                    if (fn.endswith(".cif.gz") and len(fn) == 11) or (fn.endswith(".cif") and len(fn) == 8):
-                        locator = os.path.join(root, fn)
-                        kwD = HashableDict({})
-                        oL = [HashableDict({"locator": locator, "fmt": "mmcif", "kwargs": kwD})]
-                        for mergeContentType in mergeContentTypes:
-                            idCode = fn[:4] if fn and len(fn) >= 8 else None
-                            mergeLocator = self.__getLocator(mergeContentType, idCode, checkExists=True) if idCode else None
-                            if mergeLocator:
-                                kwD = HashableDict({"marshalHelper": toCifWrapper})
-                                oL.append(HashableDict({"locator": mergeLocator, "fmt": "xml", "kwargs": kwD}))
-                        lObj = tuple(oL)
-                        locatorObjList.append(lObj)
+            for locator in _scanRepoPaths(dd, _isEntryFileName):
+                fn = os.path.basename(locator)
+                idCode = fn[:4] if fn and len(fn) >= 8 else None
+                oL = [HashableDict({"locator": locator, "fmt": "mmcif", "kwargs": _EMPTY_KW})]
+                for mergeContentType in mergeContentTypes:
+                    if not idCode:
+                        mergeLocator = None
+                    elif isLocal:
+                        mergeLocator = self.__getLocator(mergeContentType, idCode)
+                        mergeLocator = mergeLocator if self.__localPathExists(mergeLocator, dirNameCacheD) else None
+                    else:
+                        mergeLocator = self.__getLocator(mergeContentType, idCode, checkExists=True)
+                    if mergeLocator:
+                        oL.append(HashableDict({"locator": mergeLocator, "fmt": "xml", "kwargs": _VRPT_KW}))
+                lObj = tuple(oL)
+                locatorObjList.append(lObj)
         return dataList, locatorObjList, []
 
+    def __localPathExists(self, pth, dirNameCacheD):
+        """Test the existence of the input local file path. The parent directory is first looked up in a
+        listing of the directory above it (cached in dirNameCacheD), so that no stat() call is made for files
+        in missing directories (e.g., entries without validation reports).
+
+        Args:
+            pth (str): local file path
+            dirNameCacheD (dict): directory listing cache {directory path: frozenset(subdirectory names), ...}
+
+        Returns:
+            bool: True if the file exists or False otherwise
+        """
+        if not pth:
+            return False
+        topPath, parentName = os.path.split(os.path.dirname(pth))
+        nameS = dirNameCacheD.get(topPath)
+        if nameS is None:
+            try:
+                with os.scandir(topPath) as it:
+                    nameS = frozenset(entry.name for entry in it if entry.is_dir())
+            except OSError:
+                nameS = frozenset()
+            dirNameCacheD[topPath] = nameS
+        return parentName in nameS and self.__mU.exists(pth)
+
     def __getEntryLocatorObjList(self, mergeContentTypes=None):
         return self.__fetchEntryLocatorObjList(self.__getRepoLocalPath("pdbx"), numProc=self.__numProc, mergeContentTypes=mergeContentTypes)
 
@@ -759,24 +1165,12 @@ class RepositoryProvider(object):
         startTime = time.time()
         pathList = []
         try:
-            dataList = []
-            anL = "abcdefghijklmnopqrstuvwxyz0123456789"
-            for a1 in anL:
-                for a2 in anL:
-                    hc = a1 + a2
-                    dataList.append(hc)
-                    hc = a2 + a1
-                    dataList.append(hc)
-            dataList = list(set(dataList))
+            dataList = _listHashDirNames(topRepoPath, _ENTRY_HASH_DIR_NAMES)
             #
             optD = {}
             optD["topRepoPath"] = topRepoPath
             optD["mergeContentTypes"] = mergeContentTypes
-            mpu = MultiProcUtil(verbose=self.__verbose)
-            mpu.setOptions(optionsD=optD)
-            mpu.set(workerObj=self, workerMethod="_entryLocatorObjWithMergeWorker")
-            _, _, retLists, _ = mpu.runMulti(dataList=dataList, numProc=numProc, numResults=1)
-            pathList = retLists[0]
+            pathList = self.__runScanWorker(self._entryLocatorObjWithMergeWorker, dataList, optD, numProc)
             endTime0 = time.time()
             logger.debug("Locator object list length %d  in %.4f seconds", len(pathList), endTime0 - startTime)
         except Exception as e:
@@ -791,12 +1185,7 @@ class RepositoryProvider(object):
         pathList = []
         for subdir in dataList:
             dd = os.path.join(topRepoPath, subdir)
-            for root, _, files in os.walk(dd, topdown=False):
-                if "REMOVE" in root:
-                    continue
-                for name in files:
-                    if (name.endswith(".cif.gz") and len(name) == 11) or (name.endswith(".cif") and len(name) == 8):
-                        pathList.append(os.path.join(root, name))
+            pathList.extend(_scanRepoPaths(dd, _isEntryFileName))
         return dataList, pathList, []
 
     def _compModelPathWorker(self, dataList, procName, optionsD, workingDir):
@@ -822,10 +1211,10 @@ class RepositoryProvider(object):
         return dataList, pathList, []
 
     def __getEntryPathList(self):
-        return self.__fetchEntryPathList(self.__getRepoLocalPath("pdbx"), numProc=self.__numProc)
+        return self.__getScanPathList(self.__fetchEntryPathList, self.__getRepoLocalPath("pdbx"), numProc=self.__numProc)
 
     def getObsoleteEntryPathList(self):
-        return self.__fetchEntryPathList(self.__getRepoLocalPath("pdbx_obsolete"), numProc=self.__numProc)
+        return self.__getScanPathList(self.__fetchEntryPathList, self.__getRepoLocalPath("pdbx_obsolete"), numProc=self.__numProc)
 
     def __fetchEntryPathList(self, topRepoPath, numProc=8):
         """Get the path list for structure entries in the input repository"""
@@ -834,23 +1223,11 @@ class RepositoryProvider(object):
         startTime = time.time()
         pathList = []
         try:
-            dataList = []
-            anL = "abcdefghijklmnopqrstuvwxyz0123456789"
-            for a1 in anL:
-                for a2 in anL:
-                    hc = a1 + a2
-                    dataList.append(hc)
-                    hc = a2 + a1
-                    dataList.append(hc)
-            dataList = list(set(dataList))
+            dataList = _listHashDirNames(topRepoPath, _ENTRY_HASH_DIR_NAMES)
             #
             optD = {}
             optD["topRepoPath"] = topRepoPath
-            mpu = MultiProcUtil(verbose=self.__verbose)
-            mpu.setOptions(optionsD=optD)
-            mpu.set(workerObj=self, workerMethod="_entryPathWorker")
-            _, _, retLists, _ = mpu.runMulti(dataList=dataList, numProc=numProc, numResults=1)
-            pathList = retLists[0]
+            pathList = self.__runScanWorker(self._entryPathWorker, dataList, optD, numProc)
             endTime0 = time.time()
             logger.debug("Path list length %d  in %.4f seconds", len(pathList), endTime0 - startTime)
         except Exception as e:
@@ -858,7 +1235,7 @@ class RepositoryProvider(object):
         return self.__applyLimit(pathList)
 
     def __getBirdPathList(self):
-        return self.__fetchBirdPathList(self.__getRepoLocalPath("bird"))
+        return self.__getScanPathList(self.__fetchBirdPathList, self.__getRepoLocalPath("bird"))
 
     def __fetchBirdPathList(self, topRepoPath):
         """Return the list of definition file paths in the current repository.
@@ -867,24 +1244,16 @@ class RepositoryProvider(object):
         """
         pathList = []
         try:
-            sd = {}
-            for root, _, files in os.walk(topRepoPath, topdown=False):
-                if "REMOVE" in root:
-                    continue
-                for name in files:
-                    if name.startswith("PRD_") and name.endswith(".cif") and len(name) <= 14:
-                        pth = os.path.join(root, name)
-                        sd[int(name[4:-4])] = pth
-            #
-            for k in sorted(sd.keys()):
-                pathList.append(sd[k])
+            pathList = _orderPathsByIdNumber(
+                self.__walkRepoPaths(topRepoPath, lambda name: name.startswith("PRD_") and name.endswith(".cif") and len(name) <= 14), lambda name: int(name[4:-4])
+            )
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         #
         return self.__applyLimit(pathList)
 
     def __getBirdFamilyPathList(self):
-        return self.__fetchBirdFamilyPathList(self.__getRepoLocalPath("bird_family"))
+        return self.__getScanPathList(self.__fetchBirdFamilyPathList, self.__getRepoLocalPath("bird_family"))
 
     def __fetchBirdFamilyPathList(self, topRepoPath):
         """Return the list of definition file paths in the current repository.
@@ -893,24 +1262,16 @@ class RepositoryProvider(object):
         """
         pathList = []
         try:
-            sd = {}
-            for root, _, files in os.walk(topRepoPath, topdown=False):
-                if "REMOVE" in root:
-                    continue
-                for name in files:
-                    if name.startswith("FAM_") and name.endswith(".cif") and len(name) <= 14:
-                        pth = os.path.join(root, name)
-                        sd[int(name[4:-4])] = pth
-            #
-            for k in sorted(sd.keys()):
-                pathList.append(sd[k])
+            pathList = _orderPathsByIdNumber(
+                self.__walkRepoPaths(topRepoPath, lambda name: name.startswith("FAM_") and name.endswith(".cif") and len(name) <= 14), lambda name: int(name[4:-4])
+            )
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         #
         return self.__applyLimit(pathList)
 
     def __getBirdChemCompPathList(self):
-        return self.__fetchBirdChemCompPathList(self.__getRepoLocalPath("bird_chem_comp"))
+        return self.__getScanPathList(self.__fetchBirdChemCompPathList, self.__getRepoLocalPath("bird_chem_comp"))
 
     def __fetchBirdChemCompPathList(self, topRepoPath):
         """Return the list of definition file paths in the current repository.
@@ -919,22 +1280,43 @@ class RepositoryProvider(object):
         """
         pathList = []
         try:
-            sd = {}
-            for root, _, files in os.walk(topRepoPath, topdown=False):
-                if "REMOVE" in root:
-                    continue
-                for name in files:
-                    if name.startswith("PRDCC_") and name.endswith(".cif") and len(name) <= 16:
-                        pth = os.path.join(root, name)
-                        sd[int(name[6:-4])] = pth
-            #
-            for k in sorted(sd.keys()):
-                pathList.append(sd[k])
+            pathList = _orderPathsByIdNumber(
+                self.__walkRepoPaths(topRepoPath, lambda name: name.startswith("PRDCC_") and name.endswith(".cif") and len(name) <= 16), lambda name: int(name[6:-4])
+            )
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         #
         return self.__applyLimit(pathList)
 
+    def __walkRepoPaths(self, topRepoPath, nameFilter):
+        """Return the paths of the files in the input repository tree with names accepted by the input filter,
+        skipping directories with paths containing "REMOVE". The top-level (hash) subdirectories are walked
+        concurrently, as the scan time is dominated by blocking directory reads.
+
+        Args:
+            topRepoPath (str): repository top path
+            nameFilter (function): f(fileName) -> bool selecting the files to return
+
+        Returns:
+            (list): file paths
+        """
+        pathList = []
+        if "REMOVE" in topRepoPath or not os.path.isdir(topRepoPath):
+            return pathList
+        subDirL = []
+        with os.scandir(topRepoPath) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if "REMOVE" not in entry.name and not entry.is_symlink():
+                        subDirL.append(entry.path)
+                elif nameFilter(entry.name):
+                    pathList.append(entry.path)
+        #
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(self.__numProc, len(subDirL)))) as executor:
+            for pL in executor.map(lambda subDir: list(_scanRepoPaths(subDir, nameFilter)), subDirL):
+                pathList.extend(pL)
+        return pathList
+
     def __applyLimit(self, itemList):
         logger.debug("Length of item list %d (limit %r)", len(itemList), self.__fileLimit)
         if self.__fileLimit:
@@ -956,13 +1338,18 @@ class RepositoryProvider(object):
             FAM_000010 PRD_000049
             FAM_000010 PRD_000051
         #
+
+        The index records the family definition path and container index for each PRD identifier,
+        and it is built once and reused by subsequent calls.
         """
+        if self.__familyIndexCache is not None:
+            return self.__familyIndexCache
         prdD = {}
         try:
-            pthL = self.getLocatorPaths(self.__getLocatorList("bird_family"))
+            pthL = self.__getRefDataPathList("bird_family")
             for pth in pthL:
                 containerL = self.__mU.doImport(pth, fmt="mmcif")
-                for container in containerL:
+                for jj, container in enumerate(containerL):
                     catName = "pdbx_reference_molecule_list"
                     if container.exists(catName):
                         catObj = container.getObj(catName)
@@ -971,7 +1358,9 @@ class RepositoryProvider(object):
                             prdId = catObj.getValue(attributeName="prd_id", rowIndex=ii)
                             if prdId in prdD:
                                 logger.debug("duplicate prdId in family index %s %s", prdId, familyPrdId)
-                            prdD[prdId] = {"familyPrdId": familyPrdId, "c": container}
+                            prdD[prdId] = {"familyPrdId": familyPrdId, "familyPath": pth, "containerIndex": jj}
+            if prdD:
+                self.__familyIndexCache = prdD
         except Exception as e:
             logger.exception("Failing with %s", str(e))
 
@@ -981,12 +1370,16 @@ class RepositoryProvider(object):
         """Using information from the PRD pdbx_reference_molecule category to
         index the BIRDs corresponding small molecule correspondences
 
+        The index for each input identifier set is built once and reused by subsequent calls.
         """
+        cacheKey = frozenset(idCodeList) if idCodeList else frozenset()
+        if cacheKey in self.__birdCcIndexCacheD:
+            return self.__birdCcIndexCacheD[cacheKey]
         prdD = {}
         ccPathD = {}
         prdStatusD = {}
         try:
-            ccPathL = self.getLocatorPaths(self.__getLocatorList("chem_comp", inputIdCodeList=idCodeList))
+            ccPathL = self.__getRefDataPathList("chem_comp", idCodeList=idCodeList)
             logger.debug("ccPathL: %r", ccPathL)
             ccPathD = {}
             for ccPath in ccPathL:
@@ -996,39 +1389,58 @@ class RepositoryProvider(object):
             logger.info("Chemical component path list (%d)", len(ccPathD))
             # logger.info("Chemical component path list: %r", ccPathD)
             #
-            pthL = self.getLocatorPaths(self.__getLocatorList("bird", inputIdCodeList=idCodeList))
+            pthL = self.__getRefDataPathList("bird", idCodeList=idCodeList)
             logger.info("BIRD path list (%d)", len(pthL))
             # logger.info("BIRD path list: %r", pthL)
             #
-            for pth in pthL:
-                containerL = self.__mU.doImport(pth, fmt="mmcif")
-                for container in containerL:
-                    catName = "pdbx_reference_molecule"
-                    if container.exists(catName):
-                        catObj = container.getObj(catName)
-                        ii = 0
-                        prdId = catObj.getValue(attributeName="prd_id", rowIndex=ii)
-                        relStatus = catObj.getValue(attributeName="release_status", rowIndex=ii)
-                        prdStatusD[prdId] = relStatus
-                        if relStatus != "REL":
-                            continue
-                        prdRepType = catObj.getValue(attributeName="represent_as", rowIndex=ii)
-                        logger.debug("represent as %r", prdRepType)
-                        if prdRepType in ["single molecule"]:
-                            ccId = catObj.getValueOrDefault(attributeName="chem_comp_id", rowIndex=ii, defaultValue=None)
-                            # prdId = catObj.getValue(attributeName="prd_id", rowIndex=ii)
-                            logger.debug("mapping prdId %r ccId %r", prdId, ccId)
-                            if ccId and ccId in ccPathD:
-                                prdD[prdId] = {"ccId": ccId, "ccPath": ccPathD[ccId]}
-                                ccPathD[ccPathD[ccId]] = {"ccId": ccId, "prdId": prdId}
-                            else:
-                                logger.warning("Missing ccId %r referenced in BIRD %r", ccId, prdId)
+            # BIRD definitions are parsed in parallel, returning only the reference molecule details used here
+            for prdId, relStatus, prdRepType, ccId in self.__runReadWorker("_birdReferenceMoleculeWorker", pthL):
+                prdStatusD[prdId] = relStatus
+                if relStatus != "REL":
+                    continue
+                logger.debug("represent as %r", prdRepType)
+                if prdRepType in ["single molecule"]:
+                    logger.debug("mapping prdId %r ccId %r", prdId, ccId)
+                    if ccId and ccId in ccPathD:
+                        prdD[prdId] = {"ccId": ccId, "ccPath": ccPathD[ccId]}
+                        ccPathD[ccPathD[ccId]] = {"ccId": ccId, "prdId": prdId}
+                    else:
+                        logger.warning("Missing ccId %r referenced in BIRD %r", ccId, prdId)
 
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         logger.info("Candidate Chemical Components (%d) BIRDS (%d) BIRD status details (%d)", len(prdD), len(ccPathD), len(prdStatusD))
+        if prdStatusD:
+            self.__birdCcIndexCacheD[cacheKey] = (prdD, ccPathD, prdStatusD)
         return prdD, ccPathD, prdStatusD
 
+    def _birdReferenceMoleculeWorker(self, dataList, procName, optionsD, workingDir):
+        """Return the (prdId, releaseStatus, representAs, chemCompId) details from the pdbx_reference_molecule category
+        of the input BIRD definition files.
+        """
+        _ = procName
+        _ = optionsD
+        _ = workingDir
+        rL = []
+        for pth in dataList:
+            try:
+                for container in self.__mU.doImport(pth, fmt="mmcif"):
+                    catName = "pdbx_reference_molecule"
+                    if container.exists(catName):
+                        catObj = container.getObj(catName)
+                        ii = 0
+                        rL.append(
+                            (
+                                catObj.getValue(attributeName="prd_id", rowIndex=ii),
+                                catObj.getValue(attributeName="release_status", rowIndex=ii),
+                                catObj.getValueOrDefault(attributeName="represent_as", rowIndex=ii, defaultValue=None),
+                                catObj.getValueOrDefault(attributeName="chem_comp_id", rowIndex=ii, defaultValue=None),
+                            )
+                        )
+            except Exception as e:
+                logger.exception("Failing for %r with %s", pth, str(e))
+        return dataList, rL, []
+
     # -
     def mergeBirdAndChemCompRefData(self):
         # JDW note that this merging procedure expects access to all reference data -
@@ -1087,7 +1499,7 @@ class RepositoryProvider(object):
         outPathList = []
         iSkipUnreleased = 0
         try:
-            birdPathList = self.getLocatorPaths(self.__getLocatorList("bird", inputIdCodeList=idCodeList))
+            birdPathList = self.__getRefDataPathList("bird", idCodeList=idCodeList)
             birdPathD = {}
             for birdPath in birdPathList:
                 _, fn = os.path.split(birdPath)
@@ -1096,7 +1508,7 @@ class RepositoryProvider(object):
             #
             logger.info("BIRD path length %d", len(birdPathD))
             logger.debug("BIRD keys %r", list(birdPathD.keys()))
-            birdCcPathList = self.getLocatorPaths(self.__getLocatorList("bird_chem_comp", inputIdCodeList=idCodeList))
+            birdCcPathList = self.__getRefDataPathList("bird_chem_comp", idCodeList=idCodeList)
             birdCcPathD = {}
             for birdCcPath in birdCcPathList:
                 _, fn = os.path.split(birdCcPath)
@@ -1111,11 +1523,43 @@ class RepositoryProvider(object):
             logger.debug("Family index keys %r", list(fD.keys()))
             logger.info("PRD to CCD small mol index length %d", len(prdSmallMolCcD))
             #
-            for prdId in birdPathD:
+            prdIdL = []
+            for prdId in sorted(birdPathD):
                 if prdId in prdStatusD and prdStatusD[prdId] != "REL":
                     logger.debug("Skipping BIRD with non-REL status %s", prdId)
                     iSkipUnreleased += 1
                     continue
+                prdIdL.append(prdId)
+            #
+            # The consolidated definitions are built in parallel and returned in PRD identifier order. Workers
+            # read the family definitions themselves, so only their paths are passed in the worker options.
+            familyPathD = {prdId: (fD[prdId]["familyPath"], fD[prdId]["containerIndex"]) for prdId in fD}
+            optD = {"birdPathD": birdPathD, "birdCcPathD": birdCcPathD, "prdSmallMolCcD": prdSmallMolCcD, "familyPathD": familyPathD}
+            outPathS = set(self.__runReadWorker("_mergeBirdRefDataWorker", prdIdL, optionsD=optD))
+            outPathList = [fp for fp in (os.path.join(self.__cachePath, prdId + ".cif") for prdId in prdIdL) if fp in outPathS]
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        #
+        logger.info("Merged BIRD/Family/CC path length %d (skipped non-released %d)", len(outPathList), iSkipUnreleased)
+        return outPathList
+        #
+
+    def _mergeBirdRefDataWorker(self, dataList, procName, optionsD, workingDir):
+        """Consolidate the BIRD definitions for the input PRD identifiers with any associated chemical component,
+        BIRD chemical component and family definitions, and return the consolidated data file paths.
+        """
+        _ = procName
+        _ = workingDir
+        birdPathD = optionsD["birdPathD"]
+        birdCcPathD = optionsD["birdCcPathD"]
+        prdSmallMolCcD = optionsD["prdSmallMolCcD"]
+        familyPathD = optionsD["familyPathD"]
+        aaGet = _AA_ONE_LETTER_CODE_D.get
+        # Family definitions are shared by many BIRDs and are read once per worker {path: [container, ...], ...}
+        familyContainerD = {}
+        outPathList = []
+        for prdId in dataList:
+            try:
                 fp = os.path.join(self.__cachePath, prdId + ".cif")
                 logger.debug("Export cache path is %r", fp)
                 #
@@ -1127,32 +1571,6 @@ class RepositoryProvider(object):
                 # --- JDW
                 # add missing one_letter_codes item
                 if cFull.exists("pdbx_reference_entity_sequence") and cFull.exists("pdbx_reference_entity_poly_seq"):
-                    aaDict3 = {
-                        "ALA": "A",
-                        "ARG": "R",
-                        "ASN": "N",
-                        "ASP": "D",
-                        "ASX": "B",
-                        "CYS": "C",
-                        "GLN": "Q",
-                        "GLU": "E",
-                        "GLX": "Z",
-                        "GLY": "G",
-                        "HIS": "H",
-                        "ILE": "I",
-                        "LEU": "L",
-                        "LYS": "K",
-                        "MET": "M",
-                        "PHE": "F",
-                        "PRO": "P",
-                        "SER": "S",
-                        "THR": "T",
-                        "TRP": "W",
-                        "TYR": "Y",
-                        "VAL": "V",
-                        "PYL": "O",
-                        "SEC": "U",
-                    }
                     catObj = cFull.getObj("pdbx_reference_entity_sequence")
                     if not catObj.hasAttribute("one_letter_codes"):
                         logger.debug("adding one letter codes for %r", prdId)
@@ -1168,8 +1586,7 @@ class RepositoryProvider(object):
                         for ii in range(catObj.getRowCount()):
                             entityId = catObj.getValue("ref_entity_id", ii)
                             if entityId in seqD:
-                                ttL = [aaDict3[tt] if tt in aaDict3 else "X" for tt in seqD[entityId]]
-                                catObj.setValue("".join(ttL), "one_letter_codes", ii)
+                                catObj.setValue("".join([aaGet(tt, "X") for tt in seqD[entityId]]), "one_letter_codes", ii)
                             else:
                                 logger.error("%r missing sequence for entity %r", prdId, entityId)
                 # ---
@@ -1193,9 +1610,15 @@ class RepositoryProvider(object):
                         logger.error("(%s) Failed getting path %r: %r", prdId, pth1, str(e))
                     #
                 cFam = None
-                if prdId in fD:
-                    cFam = fD[prdId]["c"]
-                    logger.debug("Got cFam %r", cFam.getName())
+                if prdId in familyPathD:
+                    pthFam, jj = familyPathD[prdId]
+                    try:
+                        if pthFam not in familyContainerD:
+                            familyContainerD[pthFam] = self.__mU.doImport(pthFam, fmt="mmcif")
+                        cFam = familyContainerD[pthFam][jj]
+                        logger.debug("Got cFam %r", cFam.getName())
+                    except Exception as e:
+                        logger.error("(%s) Failed getting family path %r: %r", prdId, pthFam, str(e))
                 #
                 if ccD:
                     for catName in ccD.getObjNameList():
@@ -1210,12 +1633,9 @@ class RepositoryProvider(object):
                 #
                 self.__mU.doExport(fp, [cFull], fmt="mmcif")
                 outPathList.append(fp)
-        except Exception as e:
-            logger.exception("Failing with %s", str(e))
-        #
-        logger.info("Merged BIRD/Family/CC path length %d (skipped non-released %d)", len(outPathList), iSkipUnreleased)
-        return outPathList
-        #
+            except Exception as e:
+                logger.exception("Failing for %r with %s", prdId, str(e))
+        return dataList, outPathList, []
 
     def __getCompModelPathList(self, idCodeList=None, fmt="mmcif"):
         return self.__fetchModelPathList(self.__getRepoLocalPath("pdbx_comp_model_core"), idCodeList=idCodeList, fmt=fmt, numProc=self.__numProc)
@@ -1250,7 +1670,7 @@ class RepositoryProvider(object):
         return self.__applyLimit(pathList)
 
     def __getIhmDevPathList(self):
-        return self.__fetchIhmDevPathList(self.__getRepoLocalPath("ihm_dev"))
+        return self.__getScanPathList(self.__fetchIhmDevPathList, self.__getRepoLocalPath("ihm_dev"))
 
     def __fetchIhmDevPathList(self, topRepoPath):
         """Return the list of I/HM entries in the current repository.
@@ -1262,17 +1682,9 @@ class RepositoryProvider(object):
         pathList = []
         logger.debug("Searching path %r", topRepoPath)
         try:
-            sd = {}
-            for root, _, files in os.walk(topRepoPath, topdown=False):
-                if "REMOVE" in root:
-                    continue
-                for name in files:
-                    if name.startswith("PDBDEV_") and name.endswith(".cif.gz") and len(name) <= 50:
-                        pth = os.path.join(root, name)
-                        sd[int(name[7:15])] = pth
-            #
-            for k in sorted(sd.keys()):
-                pathList.append(sd[k])
+            pathList = _orderPathsByIdNumber(
+                _scanRepoPaths(topRepoPath, lambda name: name.startswith("PDBDEV_") and name.endswith(".cif.gz") and len(name) <= 50), lambda name: int(name[7:15])
+            )
         except Exception as e:
             logger.exception("Failing search in %r with %s", topRepoPath, str(e))
         #
@@ -10,15 +10,17 @@
 """Provide an inventory of unreleased repository content.
 """
 
+import collections.abc
 import logging
 import os.path
 
 import dateutil.parser
-from rcsb.utils.io.FileUtil import FileUtil
-from rcsb.utils.io.MarshalUtil import MarshalUtil
+from rcsb.utils.repository.HoldingsFileUtil import HoldingsFileUtil, truncateDate
 
 logger = logging.getLogger(__name__)
 
+_UNRELEASED_STATUS_CODES = frozenset(["AUCO", "AUTH", "HOLD", "HPUB", "POLC", "PROC", "REFI", "REPL", "WAIT", "WDRN"])
+
 
 class UnreleasedHoldingsProvider(object):
     """Provide an inventory of unreleased repository content."""
@@ -34,7 +36,7 @@ class UnreleasedHoldingsProvider(object):
         urlTarget = os.path.join(baseUrl, "unreleased_entries.json.gz")
         urlFallbackTarget = os.path.join(fallbackUrl, "unreleased_entries.json.gz")
         #
-        self.__mU = MarshalUtil(workPath=self.__dirPath)
+        self.__hfU = HoldingsFileUtil(workPath=self.__dirPath)
         self.__invD = self.__reload(urlTarget, urlFallbackTarget, self.__dirPath, useCache=useCache)
 
     def testCache(self, minCount=5000):
@@ -43,59 +45,35 @@ class UnreleasedHoldingsProvider(object):
             return True
         return False
 
+    def __getEntry(self, entryId):
+        if not isinstance(entryId, str):
+            logger.error("Failing for unexpected entry identifier %r", entryId)
+            return {}
+        tD = self.__invD.get(entryId)
+        return tD if tD is not None else self.__invD.get(entryId.upper(), {})
+
     def getStatusCode(self, entryId):
         """Return the status code for the unreleased entry"""
-        try:
-            return self.__invD[entryId.upper()]["status_code"]
-        except Exception as e:
-            logger.debug("Failing for %r with %s", entryId, str(e))
-        return None
+        return self.__getEntry(entryId).get("status_code")
 
     def getUnreleasedInfo(self, entryId):
         """Return the dictionary describing the details for this unreleased entry"""
-        try:
-            return self.__invD[entryId.upper()]
-        except Exception as e:
-            logger.debug("Failing for %r with %s", entryId, str(e))
-        return {}
+        return self.__getEntry(entryId)
 
     def getInventory(self):
         """Return the unreleased inventory dictionary"""
-        try:
-            return self.__invD
-        except Exception as e:
-            logger.debug("Failing with %s", str(e))
-        return {}
+        return self.__invD
 
     def __reload(self, urlTarget, urlFallbackTarget, dirPath, useCache=True):
-        invD = {}
-        fU = FileUtil()
-        fn = fU.getFileName(urlTarget)
-        fp = os.path.join(dirPath, fn)
-        self.__mU.mkdir(dirPath)
-        #
-        if self.__storeCache and useCache and self.__mU.exists(fp):
-            invD = self.__mU.doImport(fp, fmt="json")
-            logger.debug("Reading cached inventory (%d)", len(invD))
-        else:
-            invD = self.__mU.doImport(urlTarget, fmt="json")
-            logger.info("Loaded inventory from %s (%r)", urlTarget, len(invD))
-            if len(invD) == 0:
-                invD = self.__mU.doImport(urlFallbackTarget, fmt="json")
-                logger.info("Loaded fallback inventory from %s (%r)", urlFallbackTarget, len(invD))
-        #
-        if self.__storeCache:
-            logger.info("Fetch inventory from %s", urlTarget)
-            ok = fU.get(urlTarget, fp)
-            if not ok:
-                ok = fU.get(urlFallbackTarget, fp)
-        #
+        invD = self.__hfU.reload(urlTarget, urlFallbackTarget, dirPath, storeCache=self.__storeCache, useCache=useCache)
+        logger.info("Unreleased inventory (%d)", len(invD))
         return invD
 
     def getStatusDetails(self, curD):
+        curKeys = curD if isinstance(curD, (collections.abc.Mapping, collections.abc.Set)) else set(curD)
         sD = {}
         for entryId, tD in self.__invD.items():
-            if entryId not in curD and tD["status_code"] in ["AUCO", "AUTH", "HOLD", "HPUB", "POLC", "PROC", "REFI", "REPL", "WAIT", "WDRN"]:
+            if entryId not in curKeys and tD["status_code"] in _UNRELEASED_STATUS_CODES:
                 sD[entryId] = {"status": "UNRELEASED", "status_code": tD["status_code"]}
         return sD
 
@@ -128,18 +106,16 @@ class UnreleasedHoldingsProvider(object):
             "release_date",
             "hold_date_coordinates",
         ]
+        # Resolve the date handling once rather than for each entry attribute
+        dateFunc = dateutil.parser.parse if self.__assignDates else truncateDate
+        planL = [(iky, oky, oky in dateFields) for iky, oky in mapD.items()]
         retD = {}
         for entryId, tD in invD.items():
             qD = {}
-            for iky, oky in mapD.items():
+            for iky, oky, isDate in planL:
                 if iky not in tD:
                     continue
-                if self.__assignDates and oky in dateFields:
-                    qD[oky] = dateutil.parser.parse(tD[iky])
-                elif oky in dateFields:
-                    qD[oky] = tD[iky][:10]
-                else:
-                    qD[oky] = tD[iky]
+                qD[oky] = dateFunc(tD[iky]) if isDate else tD[iky]
                 #
                 if iky == "author_prerelease_sequence_status":
                     qD[oky] = str(qD[oky]).strip().replace("REALEASE", "RELEASE")
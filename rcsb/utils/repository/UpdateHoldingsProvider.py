@@ -14,6 +14,7 @@ import logging
 import os.path
 
 from rcsb.utils.io.MarshalUtil import MarshalUtil
+from rcsb.utils.repository.HoldingsFileUtil import HoldingsFileUtil
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,7 @@ class UpdateHoldingsProvider(object):
         fallbackUrl = kwargs.get("updateFallbackUrl", "https://files.wwpdb.org/pub/pdb/data/status/latest")
         #
         self.__mU = MarshalUtil(workPath=self.__dirPath)
+        self.__hfU = HoldingsFileUtil(workPath=self.__dirPath)
         self.__updD = self.__reloadUpdateLists(baseUrl, fallbackUrl, self.__dirPath, useCache=useCache)
 
     def testCache(self, minCount=100):
@@ -65,7 +67,7 @@ class UpdateHoldingsProvider(object):
         retD = {}
         fp = os.path.join(dirPath, "update_holdings.json")
         if useCache and self.__mU.exists(fp):
-            retD = self.__mU.doImport(fp, fmt="json")
+            retD = self.__hfU.importJson(fp)
             logger.debug("Reading update cached IDs  (%d)", len(retD))
         else:
             try:
@@ -17,6 +17,8 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2.0"
 
 
+import gzip
+import json
 import logging
 import os
 import time
@@ -64,11 +66,17 @@ class CurrentHoldingsProviderTests(unittest.TestCase):
             cD = chP.getEntryInventory()
             logger.info("current inventory (%d)", len(cD))
             self.assertGreaterEqual(len(cD), listLen)
+            sD = chP.getStatusDetails()
+            self.assertEqual(len(sD), len(cD))
+            self.assertEqual(sD["1KIP"]["status_code"], "REL")
             #
             entryId = "1kip"
             ctL = chP.getEntryContentTypes(entryId)
             logger.info("ctL (%d) %r ", len(ctL), ctL)
             self.assertGreaterEqual(len(ctL), 8)
+            self.assertEqual(chP.normalizeId(entryId), "1KIP")
+            self.assertEqual(chP.getEntryContentTypes(chP.normalizeId(entryId)), ctL)
+            self.assertIn(chP.normalizeId(entryId), chP.getEntriesByContentType("mmcif"))
             #
             for ct in ctL:
                 fL = chP.getEntryContentTypePathList(entryId, ct)
@@ -89,11 +97,71 @@ class CurrentHoldingsProviderTests(unittest.TestCase):
 
         except Exception as e:
             logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testEntryCurrentLocal(self):
+        """Test case - get current holdings from local holdings files (preprocessed side cache, identifier case and content type index)"""
+        try:
+            holdingsPath = os.path.join(HERE, "test-output", "current-holdings")
+            cachePath = os.path.join(holdingsPath, "CACHE")
+            os.makedirs(holdingsPath, exist_ok=True)
+            contentD = {
+                "1abc": {"mmcif": ["pdb/data/structures/divided/mmCIF/ab/1abc.cif.gz"], "validation_report": ["validation_reports/ab/1abc/1abc_validation.xml.gz"]},
+                "2DEF": {"mmcif": ["pdb/data/structures/divided/mmCIF/de/2def.cif.gz"]},
+            }
+            idD = {"1ABC": "2019-05-01T00:00:00+00:00", "2DEF": "2020-01-01T00:00:00.500000+00:00"}
+            for fn, tD in [("current_file_holdings.json.gz", contentD), ("released_structures_last_modified_dates.json.gz", idD)]:
+                with gzip.open(os.path.join(holdingsPath, fn), "wt", encoding="utf-8") as ofh:
+                    json.dump(tD, ofh)
+            edmapsPath = os.path.join(holdingsPath, "edmaps.json")
+            with open(edmapsPath, "w", encoding="utf-8") as ofh:
+                json.dump({"1abc": {"2fofc": "true", "fofc": "true"}}, ofh)
+            #
+            sideCachePath = os.path.join(cachePath, "holdings", "current_holdings_preprocessed.pic")
+            for useCache in [False, True]:
+                chP = CurrentHoldingsProvider(cachePath, useCache, storeCache=True, holdingsTargetUrl=holdingsPath, holdingsFallbackUrl=holdingsPath, edmapsLocator=edmapsPath)
+                self.assertTrue(os.path.exists(sideCachePath))
+                self.assertEqual(sorted(chP.getEntryInventory()), ["1ABC", "2DEF"])
+                self.assertEqual(chP.getEntryContentTypes("1abc"), ["mmcif", "mtz_map_coefficients", "validation_report"])
+                self.assertEqual(chP.getEntryContentTypes("1ABC"), chP.getEntryContentTypes("1abc"))
+                self.assertEqual(chP.getEntryContentTypes(None), [])
+                self.assertFalse(chP.hasEntryContentType(None, "mmcif"))
+                self.assertTrue(chP.hasEntryContentType("2def", "mmcif"))
+                self.assertTrue(chP.hasValidationReportData("1abc"))
+                self.assertFalse(chP.hasValidationReportData("2DEF"))
+                self.assertEqual(chP.getEntriesByContentType("mmcif"), {"1ABC", "2DEF"})
+                self.assertEqual(chP.getEntriesByContentType("validation_report"), {"1ABC"})
+                self.assertEqual(chP.getEntriesByContentType("unknown"), frozenset())
+                self.assertEqual(chP.getEntryIdList(), ["1ABC", "2DEF"])
+                self.assertEqual(chP.getEntryIdList(afterDateTimeStamp="2020-01-01T00:00:00"), ["2DEF"])
+                # Input time stamps are interpreted as UTC
+                self.assertEqual(chP.getEntryIdList(afterDateTimeStamp="2019-05-01T02:00:00+05:00"), ["2DEF"])
+                self.assertEqual(chP.getEntryIdList(afterDateTimeStamp="not a date"), [])
+                sD = chP.getStatusDetails()
+                self.assertIs(type(sD), dict)
+                self.assertEqual(sD["2DEF"], {"status": "CURRENT", "status_code": "REL"})
+                self.assertEqual(json.loads(json.dumps(sD)), sD)
+                sD["1ABC"]["status"] = "OBSOLETE"
+                self.assertEqual(sD["2DEF"]["status"], "CURRENT")
+                self.assertEqual(chP.getStatusDetails()["1ABC"]["status"], "CURRENT")
+            #
+            # The side cache is rebuilt when a cached holdings file changes
+            contentD["3GHI"] = {"mmcif": ["pdb/data/structures/divided/mmCIF/gh/3ghi.cif.gz"]}
+            with gzip.open(os.path.join(cachePath, "holdings", "current_file_holdings.json.gz"), "wt", encoding="utf-8") as ofh:
+                json.dump(contentD, ofh)
+            chP = CurrentHoldingsProvider(cachePath, True, storeCache=True, holdingsTargetUrl=holdingsPath, holdingsFallbackUrl=holdingsPath, edmapsLocator=edmapsPath)
+            self.assertEqual(sorted(chP.getEntryInventory()), ["1ABC", "2DEF", "3GHI"])
+            chP = CurrentHoldingsProvider(cachePath, True, storeCache=True, holdingsTargetUrl=holdingsPath, holdingsFallbackUrl=holdingsPath, edmapsLocator=edmapsPath)
+            self.assertEqual(sorted(chP.getEntryInventory()), ["1ABC", "2DEF", "3GHI"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
 
 
 def holdingsSuite():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(CurrentHoldingsProviderTests("testEntryCurrent"))
+    suiteSelect.addTest(CurrentHoldingsProviderTests("testEntryCurrentLocal"))
     return suiteSelect
 
 
@@ -0,0 +1,122 @@
+##
+# File:    testHoldingsFileUtil.py
+# Date:    16-Oct-2026
+#
+# Updates:
+#
+##
+"""
+Tests for holdings file fetching, caching and decoding utilities.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "john.westbrook@rcsb.org"
+__license__ = "Apache 2.0"
+
+
+import gzip
+import json
+import logging
+import os
+import time
+import unittest
+
+from rcsb.utils.repository.HoldingsFileUtil import HoldingsFileUtil
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class HoldingsFileUtilTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "holdings-file-util")
+        self.__cachePath = os.path.join(self.__workPath, "holdings")
+        self.__holdingsD = {"1ABC": ["mmcif", "pdb"], "2DEF": ["mmcif"]}
+        os.makedirs(self.__workPath, exist_ok=True)
+        self.__srcPath = os.path.join(self.__workPath, "test_holdings.json.gz")
+        with gzip.open(self.__srcPath, "wt", encoding="utf-8") as ofh:
+            json.dump(self.__holdingsD, ofh)
+        #
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)\n", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testImportJson(self):
+        """Test case - decode local gzipped and multi-member gzipped holdings files"""
+        try:
+            hfU = HoldingsFileUtil(workPath=self.__workPath)
+            self.assertEqual(hfU.importJson(self.__srcPath), self.__holdingsD)
+            #
+            fp = os.path.join(self.__workPath, "test_holdings_multi.json.gz")
+            tS = json.dumps(self.__holdingsD).encode("utf-8")
+            with open(fp, "wb") as ofh:
+                ofh.write(gzip.compress(tS[:10]) + gzip.compress(tS[10:]))
+            self.assertEqual(hfU.importJson(fp), self.__holdingsD)
+            self.assertEqual(hfU.importJson(os.path.join(self.__workPath, "missing.json.gz")), {})
+            #
+            # A corrupt trailer recording an implausible uncompressed length is not used to presize the output buffer
+            fp = os.path.join(self.__workPath, "test_holdings_corrupt.json.gz")
+            with open(fp, "wb") as ofh:
+                ofh.write(gzip.compress(tS)[:-4] + (0xFFFFFFF0).to_bytes(4, "little"))
+            self.assertEqual(hfU.importJson(fp), {})
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testReloadCached(self):
+        """Test case - reload a holdings file through the local cache"""
+        try:
+            hfU = HoldingsFileUtil(workPath=self.__workPath)
+            rD = hfU.reload(self.__srcPath, self.__srcPath, self.__cachePath, storeCache=True, useCache=False)
+            self.assertEqual(rD, self.__holdingsD)
+            self.assertTrue(os.path.exists(os.path.join(self.__cachePath, "test_holdings.json.gz")))
+            self.assertFalse(os.path.exists(os.path.join(self.__cachePath, "test_holdings.json")))
+            self.assertTrue(os.path.exists(os.path.join(self.__cachePath, "test_holdings.json.gz.pic")))
+            #
+            rD = hfU.reload(self.__srcPath, self.__srcPath, self.__cachePath, storeCache=True, useCache=True)
+            self.assertEqual(rD, self.__holdingsD)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testSideCache(self):
+        """Test case - validate side cache data against the layout version and the source files"""
+        try:
+            hfU = HoldingsFileUtil(workPath=self.__workPath)
+            sideCachePath = os.path.join(self.__workPath, "test_side_cache.pic")
+            self.assertIsNone(hfU.importSideCache(sideCachePath, [self.__srcPath], 1))
+            self.assertTrue(hfU.exportSideCache(sideCachePath, [self.__srcPath], 1, self.__holdingsD))
+            self.assertEqual(hfU.importSideCache(sideCachePath, [self.__srcPath], 1), self.__holdingsD)
+            self.assertIsNone(hfU.importSideCache(sideCachePath, [self.__srcPath], 2))
+            self.assertIsNone(hfU.importSideCache(sideCachePath, [self.__srcPath, os.path.join(self.__workPath, "missing.json.gz")], 1))
+            #
+            # Any change to a source file invalidates the stored data
+            with gzip.open(self.__srcPath, "wt", encoding="utf-8") as ofh:
+                json.dump({"3GHI": ["mmcif"]}, ofh)
+            self.assertIsNone(hfU.importSideCache(sideCachePath, [self.__srcPath], 1))
+            self.assertFalse(hfU.exportSideCache(sideCachePath, [os.path.join(self.__workPath, "missing.json.gz")], 1, self.__holdingsD))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def holdingsFileUtilSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(HoldingsFileUtilTests("testImportJson"))
+    suiteSelect.addTest(HoldingsFileUtilTests("testReloadCached"))
+    suiteSelect.addTest(HoldingsFileUtilTests("testSideCache"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    #
+    mySuite = holdingsFileUtilSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
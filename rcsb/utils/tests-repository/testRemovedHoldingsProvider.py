@@ -17,6 +17,8 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2.0"
 
 
+import gzip
+import json
 import logging
 import os
 import time
@@ -78,17 +80,74 @@ class RemovedHoldingsProviderTests(unittest.TestCase):
             scS = set()
             for entryId in rmP.getRemovedEntries():
                 sL = rmP.getSupersededBy(entryId)
+                self.assertEqual(len(sL), len(set(sL)))
+                self.assertNotIn(entryId, sL)
                 if len(sL) > 1:
                     logger.info("Superseded list for entryId (%r): %r", entryId, sL)
                 scS.add(rmP.getStatusCode(entryId))
             logger.info("status codes %r", scS)
         except Exception as e:
             logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testSupersededByLocal(self):
+        """Test case - get superseding entries from a local removed holdings file (superseded cycle and chain)"""
+        holdingsPath = os.path.join(HERE, "test-output", "removed-holdings")
+        os.makedirs(holdingsPath, exist_ok=True)
+        removedD = {
+            "1AAA": {"status_code": "OBS", "superseded_by": ["1BBB"], "content_type": {"mmcif": ["1aaa.cif.gz"]}},
+            "1BBB": {"status_code": "OBS", "superseded_by": ["1AAA"], "content_type": {"mmcif": ["1bbb.cif.gz"]}},
+            "2AAA": {"status_code": "OBS", "superseded_by": "2bbb", "content_type": {"mmcif": ["2aaa.cif.gz"]}},
+            "2BBB": {"status_code": "OBS", "superseded_by": ["2CCC"], "content_type": {"mmcif": ["2bbb.cif.gz"]}},
+        }
+        with gzip.open(os.path.join(holdingsPath, "all_removed_entries.json.gz"), "wt", encoding="utf-8") as ofh:
+            json.dump(removedD, ofh)
+        #
+        rmP = RemovedHoldingsProvider(os.path.join(holdingsPath, "CACHE"), False, holdingsTargetUrl=holdingsPath, holdingsFallbackUrl=holdingsPath)
+        self.assertEqual(sorted(rmP.getRemovedEntries()), sorted(removedD))
+        self.assertEqual(rmP.getSupersededBy("1AAA"), ["1BBB"])
+        self.assertEqual(rmP.getSupersededBy("1bbb"), ["1AAA"])
+        self.assertEqual(rmP.getSupersededBy("2AAA"), ["2BBB", "2CCC"])
+        self.assertEqual(rmP.getSupersededBy("2aaa"), ["2BBB", "2CCC"])
+        self.assertEqual(rmP.getSupersededBy("2BBB"), ["2CCC"])
+        self.assertEqual(rmP.getSupersededBy(None), [])
+        self.assertIsNone(rmP.getStatusCode(None))
+        self.assertEqual(rmP.getContentTypes(None), [])
+
+    def testSideCacheLocal(self):
+        """Test case - rebuild the preprocessed removed holdings when the cached holdings file changes"""
+        try:
+            holdingsPath = os.path.join(HERE, "test-output", "removed-holdings-cache")
+            cachePath = os.path.join(holdingsPath, "CACHE")
+            os.makedirs(holdingsPath, exist_ok=True)
+            removedD = {"1AAA": {"status_code": "OBS", "superseded_by": ["1BBB"], "content_type": {"mmcif": ["1aaa.cif.gz"]}}}
+            with gzip.open(os.path.join(holdingsPath, "all_removed_entries.json.gz"), "wt", encoding="utf-8") as ofh:
+                json.dump(removedD, ofh)
+            #
+            sideCachePath = os.path.join(cachePath, "holdings", "removed_holdings_preprocessed.pic")
+            for useCache in [False, True]:
+                rmP = RemovedHoldingsProvider(cachePath, useCache, storeCache=True, holdingsTargetUrl=holdingsPath, holdingsFallbackUrl=holdingsPath)
+                self.assertTrue(os.path.exists(sideCachePath))
+                self.assertEqual(rmP.getRemovedEntries(), ["1AAA"])
+                self.assertEqual(rmP.getEntryByStatus("OBS"), ["1AAA"])
+            #
+            removedD["2AAA"] = {"status_code": "TRSF", "content_type": {"mmcif": ["2aaa.cif.gz"]}}
+            with gzip.open(os.path.join(cachePath, "holdings", "all_removed_entries.json.gz"), "wt", encoding="utf-8") as ofh:
+                json.dump(removedD, ofh)
+            for _ in range(2):
+                rmP = RemovedHoldingsProvider(cachePath, True, storeCache=True, holdingsTargetUrl=holdingsPath, holdingsFallbackUrl=holdingsPath)
+                self.assertEqual(sorted(rmP.getRemovedEntries()), ["1AAA", "2AAA"])
+                self.assertEqual(rmP.getEntryByStatus("TRSF"), ["2AAA"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
 
 
 def holdingsSuite():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(RemovedHoldingsProviderTests("testRemoved"))
+    suiteSelect.addTest(RemovedHoldingsProviderTests("testSupersededByLocal"))
+    suiteSelect.addTest(RemovedHoldingsProviderTests("testSideCacheLocal"))
     return suiteSelect
 
 
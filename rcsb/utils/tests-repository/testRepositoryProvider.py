@@ -19,6 +19,7 @@ __license__ = "Apache 2.0"
 
 import logging
 import os
+import shutil
 import time
 import unittest
 
@@ -151,11 +152,198 @@ class RepositoryProviderTests(unittest.TestCase):
         locL = rpP.getLocatorObjList(inputIdCodeList=["ATP", "GTP"], contentType="chem_comp")
         self.assertEqual(len(locL), 2)
 
+    def testLocalSelectedRepoUtils(self):
+        """Test case - local repository locators for input identifier lists"""
+        rpP = RepositoryProvider(cfgOb=self.__cfgOb, discoveryMode="local", numProc=self.__numProc, fileLimit=None, cachePath=self.__cachePath)
+        for contentType in ["pdbx_core", "chem_comp", "bird"]:
+            locatorList = rpP.getLocatorObjList(contentType=contentType)
+            idCodes = rpP.getLocatorIdcodes(contentType, locatorList)
+            self.assertGreaterEqual(len(idCodes), 2)
+            #
+            # Input identifiers are matched case-insensitively, and identifiers without repository files are skipped
+            selectIdCodes = [idCodes[-1].lower(), idCodes[0], "ZZZZ_MISSING"]
+            locL = rpP.getLocatorObjList(contentType=contentType, inputIdCodeList=selectIdCodes)
+            logger.info("%s selected locators %r", contentType, locL)
+            self.assertEqual(locL, [locator for locator, idCode in zip(locatorList, idCodes) if idCode in (idCodes[0], idCodes[-1])])
+
+    def testContainerListOrder(self):
+        """Test case - containers are returned in the order of the input locator objects"""
+        rpP = RepositoryProvider(cfgOb=self.__cfgOb, discoveryMode="local", numProc=self.__numProc, fileLimit=self.__fileLimit, cachePath=self.__cachePath)
+        locatorObjList = rpP.getLocatorObjList(contentType="pdbx_core", mergeContentTypes=["vrpt"])
+        self.assertGreaterEqual(len(locatorObjList), 2)
+        # Repeat the reversed locator list so that it is long enough to be read in parallel
+        inputList = []
+        while len(inputList) < 40:
+            inputList.extend(reversed(locatorObjList))
+        containerList = rpP.getContainerList(inputList)
+        self.assertEqual([container.getName().upper() for container in containerList], rpP.getLocatorIdcodes("pdbx_core", inputList))
+
+
+class RepositoryProviderScanTests(unittest.TestCase):
+    """Repository scan and locator tests on a small repository tree built in the test output area."""
+
+    def setUp(self):
+        self.__configName = "site_info_configuration"
+        self.__repoPath = os.path.join(HERE, "test-output", "repo-scan")
+        self.__cachePath = os.path.join(HERE, "test-output", "CACHE")
+        self.__numProc = 2
+        if os.path.exists(self.__repoPath):
+            shutil.rmtree(self.__repoPath)
+        # Repository files including those that should be skipped by the scans (REMOVE directories, non-matching
+        # file names and files outside of the hash directories)
+        for relPath in [
+            "pdbx/ab/1abc.cif.gz",
+            "pdbx/ab/2abd.cif",
+            "pdbx/ab/1abc_validation.cif.gz",
+            "pdbx/ab/REMOVE/4abr.cif.gz",
+            "pdbx/ab/sub/5abs.cif.gz",
+            "pdbx/xy/3xyz.cif.gz",
+            "pdbx/misc/6mis.cif.gz",
+            "pdbx/7top.cif.gz",
+            "chem_comp/A/ATP/ATP.cif",
+            "chem_comp/A/ATP/ATP_model.cif",
+            "chem_comp/A/REMOVE/ABC/ABC.cif",
+            "chem_comp/G/GTP/GTP.cif",
+            "chem_comp/0/00O/00O.cif",
+            "bird/1/PRD_000001.cif",
+            "bird/2/PRD_000012.cif",
+            "bird/3/PRD_000003.cif",
+            "bird/3/PRD_000003_old.cif",
+            "bird/REMOVE/PRD_000004.cif",
+            "family/1/FAM_000001.cif",
+            "family/2/FAM_000002.cif",
+            "prdcc/1/PRDCC_000011.cif",
+            "prdcc/1/PRDCC_000001.cif",
+            "ihm/PDBDEV_00000002/PDBDEV_00000002_model_v1-0.cif.gz",
+            "ihm/PDBDEV_00000001/PDBDEV_00000001_model_v1-0.cif.gz",
+            "ihm/PDBDEV_00000001/PDBDEV_00000001.cif",
+        ]:
+            self.__makeFile(relPath)
+        #
+        self.__cfgOb = ConfigUtil(defaultSectionName=self.__configName)
+        self.__cfgOb.importConfig(
+            {
+                self.__configName: {
+                    "PDB_REPO_URL": "https://files.wwpdb.org/pub/",
+                    "PDBX_REPO_PATH": os.path.join(self.__repoPath, "pdbx"),
+                    "CHEM_COMP_REPO_PATH": os.path.join(self.__repoPath, "chem_comp"),
+                    "BIRD_REPO_PATH": os.path.join(self.__repoPath, "bird"),
+                    "BIRD_FAMILY_REPO_PATH": os.path.join(self.__repoPath, "family"),
+                    "BIRD_CHEM_COMP_REPO_PATH": os.path.join(self.__repoPath, "prdcc"),
+                    "IHM_DEV_REPO_PATH": os.path.join(self.__repoPath, "ihm"),
+                }
+            }
+        )
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)\n", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __makeFile(self, relPath):
+        pth = os.path.join(self.__repoPath, relPath)
+        os.makedirs(os.path.dirname(pth), exist_ok=True)
+        with open(pth, "w", encoding="utf-8") as ofh:
+            ofh.write("data_%s\n" % os.path.basename(pth).split(".")[0].upper())
+        return pth
+
+    def __walkPaths(self, topPath, nameFilter, subDirList=None):
+        """Reference repository walker (os.walk() over the input subdirectories skipping REMOVE directories)"""
+        pathS = set()
+        for dirPath in [os.path.join(topPath, subDir) for subDir in subDirList] if subDirList else [topPath]:
+            for root, _, files in os.walk(dirPath, topdown=False):
+                if "REMOVE" in root:
+                    continue
+                pathS.update(os.path.join(root, name) for name in files if nameFilter(name))
+        return pathS
+
+    def testLocalScan(self):
+        """Test case - local repository scans find the same paths as the reference walker"""
+        anL = "abcdefghijklmnopqrstuvwxyz0123456789"
+        expectedD = {
+            "pdbx_core": self.__walkPaths(
+                os.path.join(self.__repoPath, "pdbx"),
+                lambda name: (name.endswith(".cif.gz") and len(name) == 11) or (name.endswith(".cif") and len(name) == 8),
+                subDirList=[a1 + a2 for a1 in anL for a2 in anL],
+            ),
+            "chem_comp": self.__walkPaths(
+                os.path.join(self.__repoPath, "chem_comp"), lambda name: name.endswith(".cif") and len(name) <= 7, subDirList=list("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+            ),
+            "bird": self.__walkPaths(os.path.join(self.__repoPath, "bird"), lambda name: name.startswith("PRD_") and name.endswith(".cif") and len(name) <= 14),
+            "bird_family": self.__walkPaths(os.path.join(self.__repoPath, "family"), lambda name: name.startswith("FAM_") and name.endswith(".cif") and len(name) <= 14),
+            "bird_chem_comp": self.__walkPaths(os.path.join(self.__repoPath, "prdcc"), lambda name: name.startswith("PRDCC_") and name.endswith(".cif") and len(name) <= 16),
+            "ihm_dev": self.__walkPaths(os.path.join(self.__repoPath, "ihm"), lambda name: name.startswith("PDBDEV_") and name.endswith(".cif.gz") and len(name) <= 50),
+        }
+        expectedCountD = {"pdbx_core": 4, "chem_comp": 3, "bird": 3, "bird_family": 2, "bird_chem_comp": 2, "ihm_dev": 2}
+        rpP = RepositoryProvider(cfgOb=self.__cfgOb, discoveryMode="local", numProc=self.__numProc, cachePath=self.__cachePath)
+        for contentType, pathS in expectedD.items():
+            pathList = rpP.getLocatorPaths(rpP.getLocatorObjList(contentType=contentType))
+            logger.info("%s path list (%d)", contentType, len(pathList))
+            self.assertEqual(len(pathS), expectedCountD[contentType])
+            self.assertEqual(len(pathList), len(pathS))
+            self.assertEqual(set(pathList), pathS)
+
+    def testLocalScanSortResults(self):
+        """Test case - sortResults controls the ordering of local repository path lists"""
+        rpP = RepositoryProvider(cfgOb=self.__cfgOb, discoveryMode="local", numProc=self.__numProc, cachePath=self.__cachePath)
+        for contentType in ["pdbx_core", "chem_comp", "bird", "bird_chem_comp", "ihm_dev"]:
+            pathList = rpP.getLocatorObjList(contentType=contentType)
+            self.assertEqual(pathList, sorted(pathList))
+            self.assertEqual(set(rpP.getLocatorObjList(contentType=contentType, sortResults=False)), set(pathList))
+        #
+        # Unsorted reference data path lists are ordered by identifier number (PRD_000012 is in hash directory 2)
+        pathList = rpP.getLocatorObjList(contentType="bird", sortResults=False)
+        self.assertEqual([os.path.basename(pth) for pth in pathList], ["PRD_000001.cif", "PRD_000003.cif", "PRD_000012.cif"])
+        pathList = rpP.getLocatorObjList(contentType="bird")
+        self.assertEqual([os.path.basename(pth) for pth in pathList], ["PRD_000001.cif", "PRD_000012.cif", "PRD_000003.cif"])
+
+    def testClearScanCache(self):
+        """Test case - repository scans are retained until the scan cache is cleared"""
+        rpP = RepositoryProvider(cfgOb=self.__cfgOb, discoveryMode="local", numProc=self.__numProc, cachePath=self.__cachePath)
+        pathList = rpP.getLocatorObjList(contentType="pdbx_core")
+        self.assertEqual(len(pathList), 4)
+        newPath = self.__makeFile("pdbx/ab/8abn.cif.gz")
+        # pdbx and pdbx_core share the retained scan of the entry repository
+        self.assertEqual(rpP.getLocatorObjList(contentType="pdbx"), pathList)
+        rpP.clearScanCache()
+        pathList2 = rpP.getLocatorObjList(contentType="pdbx_core")
+        self.assertEqual(len(pathList2), 5)
+        self.assertEqual(set(pathList2) - set(pathList), {newPath})
+
+    def testRemoteLocators(self):
+        """Test case - remote locator URLs (repository base URL with a trailing separator)"""
+        rpP = RepositoryProvider(cfgOb=self.__cfgOb, discoveryMode="remote", numProc=self.__numProc, cachePath=self.__cachePath)
+        locL = rpP.getLocatorObjList(inputIdCodeList=["1kip", "4hhb"], contentType="pdbx_core", mergeContentTypes=["vrpt"])
+        self.assertEqual(
+            [[locD["locator"] for locD in locObj] for locObj in locL],
+            [
+                [
+                    "https://files.wwpdb.org/pub/pdb/data/structures/divided/mmCIF/ki/1kip.cif.gz",
+                    "https://files.wwpdb.org/pub/pdb/validation_reports/ki/1kip/1kip_validation.xml.gz",
+                ],
+                [
+                    "https://files.wwpdb.org/pub/pdb/data/structures/divided/mmCIF/hh/4hhb.cif.gz",
+                    "https://files.wwpdb.org/pub/pdb/validation_reports/hh/4hhb/4hhb_validation.xml.gz",
+                ],
+            ],
+        )
+        locL = rpP.getLocatorObjList(inputIdCodeList=["ATP", "GTP"], contentType="chem_comp")
+        self.assertEqual(
+            rpP.getLocatorPaths(locL),
+            ["https://files.wwpdb.org/pub/pdb/refdata/chem_comp/P/ATP/ATP.cif", "https://files.wwpdb.org/pub/pdb/refdata/chem_comp/P/GTP/GTP.cif"],
+        )
+
 
 def repoSuite():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(RepositoryProviderTests("testLocalRepoUtils"))
     suiteSelect.addTest(RepositoryProviderTests("testRemoteRepoUtils"))
+    suiteSelect.addTest(RepositoryProviderTests("testLocalSelectedRepoUtils"))
+    suiteSelect.addTest(RepositoryProviderTests("testContainerListOrder"))
+    suiteSelect.addTest(RepositoryProviderScanTests("testLocalScan"))
+    suiteSelect.addTest(RepositoryProviderScanTests("testLocalScanSortResults"))
+    suiteSelect.addTest(RepositoryProviderScanTests("testClearScanCache"))
     return suiteSelect
 
 